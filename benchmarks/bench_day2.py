@@ -0,0 +1,72 @@
+"""Benchmarks for day2.
+
+Run with:
+    python -m benchmarks.bench_day2
+"""
+
+import random
+import time
+
+from days.day2 import has_repeated_pattern, is_repeated_id, solve
+
+
+def synthetic_ranges(count: int, seed: int = 2025) -> list[str]:
+    """Return `count` random range strings of widely varying widths."""
+    rng = random.Random(seed)
+    ranges = []
+    for _ in range(count):
+        start = rng.randint(1, 10**15)
+        ranges.append(f"{start}-{start + rng.randint(0, 10 ** rng.randint(1, 12))}")
+    return ranges
+
+
+def bench_workers():
+    """Report solve throughput against the number of worker processes."""
+    ranges = synthetic_ranges(200_000)
+    baseline = None
+    for workers in (1, 2, 4, 8):
+        started = time.perf_counter()
+        total = solve(ranges, check_repeating=True, workers=workers)
+        elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(
+            f"workers={workers}: {elapsed:.2f}s "
+            f"({len(ranges) / elapsed:,.0f} ranges/s, {baseline / elapsed:.2f}x) total={total}"
+        )
+
+
+def _has_repeated_pattern_by_all_divisors(id_str: str) -> bool:
+    """The original string check, trying every pattern length that divides the ID."""
+    length = len(id_str)
+    for pattern_len in range(1, length // 2 + 1):
+        if length % pattern_len == 0 and id_str[:pattern_len] * (length // pattern_len) == id_str:
+            return True
+    return False
+
+
+def bench_pattern_check(samples: int = 20_000):
+    """Compare the repeated-pattern predicates for 1-20 digit IDs."""
+    rng = random.Random(6)
+    print(f"{'digits':>6} {'all divisors':>14} {'max divisors':>14} {'numeric':>14}")
+    for digits in range(1, 21):
+        ids = [rng.randint(10 ** (digits - 1), 10**digits - 1) for _ in range(samples)]
+        timings = []
+        for check in (
+            lambda id_num: _has_repeated_pattern_by_all_divisors(str(id_num)),
+            lambda id_num: has_repeated_pattern(str(id_num)),
+            is_repeated_id,
+        ):
+            started = time.perf_counter()
+            for id_num in ids:
+                check(id_num)
+            timings.append((time.perf_counter() - started) / samples * 1e9)
+        print(f"{digits:>6} " + " ".join(f"{timing:>11.0f} ns" for timing in timings))
+
+
+def main():
+    bench_pattern_check()
+    bench_workers()
+
+
+if __name__ == "__main__":
+    main()
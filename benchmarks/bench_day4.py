@@ -0,0 +1,42 @@
+"""Benchmarks for day4.
+
+Run with:
+    python -m benchmarks.bench_day4
+"""
+
+import random
+import time
+
+from days.day4 import solve, solve_numpy
+
+
+def random_grid(size: int, density: float = 0.7, seed: int = 2025) -> str:
+    """Return a size x size grid with '@' rolls at the given density."""
+    rng = random.Random(seed)
+    return "\n".join(
+        "".join("@" if rng.random() < density else "." for _ in range(size)) for _ in range(size)
+    )
+
+
+def bench_backends(sizes: tuple[int, ...] = (250, 500, 1000)):
+    """Compare the pure Python and NumPy solvers on large random grids."""
+    for size in sizes:
+        input_str = random_grid(size)
+        for iterate_until_stable in (False, True):
+            timings = []
+            for solver in (solve, solve_numpy):
+                started = time.perf_counter()
+                result = solver(input_str, iterate_until_stable)
+                timings.append(time.perf_counter() - started)
+            print(
+                f"{size}x{size} stable={iterate_until_stable!s:<5} result={result:>8} "
+                f"python={timings[0]:.2f}s numpy={timings[1]:.2f}s"
+            )
+
+
+def main():
+    bench_backends()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Benchmarks for day6.
+
+Run with:
+    python -m benchmarks.bench_day6
+"""
+
+import random
+import time
+
+from days.day6 import solve, solve_part_2
+
+
+def random_worksheet(size_bytes: int, rows: int = 4, seed: int = 2025) -> str:
+    """Return a worksheet of roughly size_bytes with `rows` rows of numbers."""
+    rng = random.Random(seed)
+    # Each problem takes 3.5 characters per row on average
+    problems = size_bytes * 2 // ((rows + 1) * 7)
+    widths = [rng.randint(1, 4) for _ in range(problems)]
+    lines = [
+        " ".join(str(rng.randint(1, 10**width - 1)).ljust(width) for width in widths)
+        for _ in range(rows)
+    ]
+    lines.append(" ".join(rng.choice("+*").ljust(width) for width in widths))
+    return "\n".join(lines)
+
+
+def bench_worksheet(size_bytes: int = 10 * 1024 * 1024):
+    """Time both parts on a large random worksheet."""
+    worksheet = random_worksheet(size_bytes)
+    print(f"worksheet: {len(worksheet) / 1024 / 1024:.1f} MB")
+    for solver in (solve, solve_part_2):
+        started = time.perf_counter()
+        solver(worksheet)
+        print(f"{solver.__name__}: {time.perf_counter() - started:.2f}s")
+
+
+def main():
+    bench_worksheet()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,19 @@
 import argparse
+import asyncio
+import hashlib
+import mmap
 import os
+import pickle
+import time
+from collections.abc import Callable, Iterator
+from itertools import groupby
 
-from data_file import DataFile
+import requests
+
+from data_file import BASE_URL, DATA_DIR, DataFile, make_session
 
 HERE = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(HERE, ".cache", "parsed")
 
 
 def get_input_string(file: str) -> str:
@@ -18,9 +28,131 @@ def get_input(file: str) -> list[str]:
         return [line.strip() for line in f.readlines()]
 
 
-def create_day_file(day: str) -> None:
+class MappedInput:
+    """A puzzle input file memory-mapped read-only.
+
+    Gives zero-copy access to the file: ``data`` is the mapping itself (it
+    supports the buffer protocol, slicing, ``find`` and ``rfind`` like bytes),
+    ``view`` returns a memoryview of it, and ``lines`` and ``sections`` yield
+    memoryview slices rather than strings. Close it (or use it as a context
+    manager) once every view has been released.
+
+    Example:
+        >>> with open_input("data/2025/1.txt") as puzzle:  # doctest: +SKIP
+        ...     rotations = sum(1 for line in puzzle.lines() if line)
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        # Zero-length files can't be mapped
+        if os.fstat(self._file.fileno()).st_size:
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.data = b""
+
+    def __enter__(self) -> "MappedInput":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self._file.close()
+
+    def view(self) -> memoryview:
+        """Return a memoryview of the whole file."""
+        return memoryview(self.data)
+
+    def lines(self) -> Iterator[memoryview]:
+        """Yield every line as a memoryview, stripped of surrounding whitespace.
+
+        Blank lines are yielded as empty views, like get_input's empty strings.
+        """
+        data = self.data
+        length = len(data)
+        start = 0
+        while start < length:
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = length
+            first, stop = start, end
+            while first < stop and data[first] in b" \t\r":
+                first += 1
+            while stop > first and data[stop - 1] in b" \t\r":
+                stop -= 1
+            yield memoryview(data)[first:stop]
+            start = end + 1
+
+    def sections(self) -> Iterator[Iterator[memoryview]]:
+        """Yield each block of non-blank lines as an iterator over its lines.
+
+        Like ``itertools.groupby``, each section must be consumed before moving
+        on to the next one.
+        """
+        return (section for has_content, section in groupby(self.lines(), key=bool) if has_content)
+
+
+def open_input(file: str) -> MappedInput:
+    """Memory-map an input file, see MappedInput."""
+    return MappedInput(os.path.join(HERE, file))
+
+
+def parse_cached[T](
+    file: str,
+    parser: Callable[[Iterator[memoryview]], T],
+    version: int = 1,
+    cache_dir: str = CACHE_DIR,
+) -> T:
+    """Parse an input file with ``parser``, reusing the result of an earlier run.
+
+    The parser is called with ``MappedInput.lines()`` and its result is pickled
+    (protocol 5) under ``cache_dir``. The cache key is the SHA-256 of the file
+    contents plus the parser's module, qualified name and ``version``, so an
+    edited input or a bumped parser version simply misses and is parsed again.
+    Unreadable or stale cache files are treated as misses too.
+
+    Args:
+        file: Input path, relative to the repository root
+        parser: Function turning the input lines into a picklable structure
+        version: Bump whenever the parser's output changes, so cached results of the
+            old parser are ignored (day modules keep it in PARSE_VERSION)
+        cache_dir: Directory holding the cached results
+
+    Returns:
+        The parsed structure
+
+    Example:
+        >>> from days.day5 import PARSE_VERSION, parse_input
+        >>> parse_cached("data/2025/5.txt", parse_input, PARSE_VERSION)  # doctest: +SKIP
+        [(3, 5), (10, 20)]
+    """
+    with open_input(file) as puzzle:
+        key = hashlib.sha256(puzzle.data)
+        key.update(f"\0{parser.__module__}.{parser.__qualname__}\0{version}".encode())
+        cache_file = os.path.join(cache_dir, f"{key.hexdigest()}.pickle")
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            pass
+        result = parser(puzzle.lines())
+
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write to a temporary name first so a concurrent or interrupted run never
+    # leaves a truncated cache file behind
+    temporary = f"{cache_file}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as f:
+        pickle.dump(result, f, protocol=5)
+    os.replace(temporary, cache_file)
+    return result
+
+
+def create_day_file(day: str, root: str = HERE) -> None:
     """Create day solution file if it doesn't exist."""
-    day_file = os.path.join(HERE, f"days/day{day}.py")
+    day_file = os.path.join(root, f"days/day{day}.py")
     if not os.path.exists(day_file):
         template = f"""from data import get_input
 
@@ -51,9 +183,9 @@ if __name__ == "__main__":
         print(f"Created {day_file}")
 
 
-def create_test_file(day: str) -> None:
+def create_test_file(day: str, root: str = HERE) -> None:
     """Create test file if it doesn't exist."""
-    test_file = os.path.join(HERE, f"tests/test_day{day}.py")
+    test_file = os.path.join(root, f"tests/test_day{day}.py")
     if not os.path.exists(test_file):
         template = f"""from days.day{day} import solve
 
@@ -69,14 +201,139 @@ def test_solve():
         print(f"Created {test_file}")
 
 
+def days_in_year(year: str) -> int:
+    """Number of puzzles in an Advent of Code event (12 from 2025 on, 25 before)."""
+    return 12 if int(year) >= 2025 else 25
+
+
+def parse_days(spec: str) -> list[int]:
+    """Parse a day selection such as "1-25" or "1,3,5-7" into sorted unique days.
+
+    Example:
+        >>> parse_days("5-7,1,6")
+        [1, 5, 6, 7]
+    """
+    days = set()
+    for part in spec.split(","):
+        first, _, last = part.strip().partition("-")
+        days.update(range(int(first), int(last or first) + 1))
+    return sorted(days)
+
+
+class RateLimiter:
+    """Let at most ``rate`` callers per second through ``acquire``, spaced evenly."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            if self._next > now:
+                await asyncio.sleep(self._next - now)
+                now = self._next
+            self._next = now + self.interval
+
+
+async def _bootstrap_day(
+    year: str,
+    day: int,
+    session: requests.Session | None,
+    limiter: RateLimiter,
+    base_url: str,
+    data_dir: str,
+    root: str,
+) -> tuple[str, float]:
+    """Download (if missing) and scaffold one day, returning its status and duration."""
+    start = time.perf_counter()
+    try:
+        status = "cached"
+        if not os.path.exists(os.path.join(data_dir, year, f"{day}.txt")):
+            await limiter.acquire()
+            data_file = await asyncio.to_thread(
+                DataFile, year, str(day), session, False, base_url, data_dir
+            )
+            status = "downloaded" if data_file.downloaded else "cached"
+        await asyncio.gather(
+            asyncio.to_thread(create_day_file, str(day), root),
+            asyncio.to_thread(create_test_file, str(day), root),
+        )
+    except Exception as error:  # Reported per day so the other days still finish
+        status = f"failed ({error})"
+    return status, time.perf_counter() - start
+
+
+async def bootstrap(
+    year: str,
+    days: list[int],
+    rate: float = 2.0,
+    workers: int = 4,
+    session: requests.Session | None = None,
+    base_url: str = BASE_URL,
+    data_dir: str = DATA_DIR,
+    root: str = HERE,
+) -> dict[int, tuple[str, float]]:
+    """Download and scaffold many days concurrently.
+
+    Downloads run on worker threads over one pooled session, with at most
+    ``workers`` in flight and new requests started at no more than ``rate`` per
+    second. Days whose input is already on disk send no request, and existing
+    solution and test files are left alone, so an interrupted run can simply be
+    repeated to finish the rest.
+
+    Returns:
+        A dict mapping each day to its (status, seconds), where status is
+        "downloaded", "cached" or "failed (reason)"
+    """
+    missing = [
+        day for day in days if not os.path.exists(os.path.join(data_dir, year, f"{day}.txt"))
+    ]
+    own_session = session is None and bool(missing)
+    if own_session:
+        session = make_session(pool_size=workers)
+
+    limiter = RateLimiter(rate)
+    slots = asyncio.Semaphore(workers)
+
+    async def run(day: int) -> tuple[str, float]:
+        async with slots:
+            return await _bootstrap_day(year, day, session, limiter, base_url, data_dir, root)
+
+    try:
+        results = await asyncio.gather(*(run(day) for day in days))
+    finally:
+        if own_session:
+            session.close()
+    return dict(zip(days, results, strict=True))
+
+
 if __name__ == "__main__":
     argparser = argparse.ArgumentParser()
-    argparser.add_argument("--year", help="The year of the puzzle")
-    argparser.add_argument("--day", help="The day of the puzzle")
+    argparser.add_argument("--year", default="2025", help="The year of the puzzle")
+    selection = argparser.add_mutually_exclusive_group(required=True)
+    selection.add_argument("--day", help="The day of the puzzle")
+    selection.add_argument(
+        "--days", type=parse_days, help='Days to bootstrap, e.g. "1-12" or "1,3"'
+    )
+    selection.add_argument("--all", action="store_true", help="Bootstrap every day of the year")
+    argparser.add_argument("--rate", type=float, default=2.0, help="Max requests per second")
+    argparser.add_argument("--workers", type=int, default=4, help="Max downloads in flight")
 
     args = argparser.parse_args()
-    print("getting data")
-    DataFile(args.year, args.day)
-    create_day_file(args.day)
-    create_test_file(args.day)
-    print("done")
+    if args.day:
+        print("getting data")
+        DataFile(args.year, args.day)
+        create_day_file(args.day)
+        create_test_file(args.day)
+        print("done")
+    else:
+        days = args.days or list(range(1, days_in_year(args.year) + 1))
+        start = time.perf_counter()
+        results = asyncio.run(bootstrap(args.year, days, args.rate, args.workers))
+        for day, (status, seconds) in results.items():
+            print(f"day {day:>2}: {status:<10} {seconds:6.2f}s")
+        print(f"done in {time.perf_counter() - start:.2f}s")
+        if any(status.startswith("failed") for status, _ in results.values()):
+            raise SystemExit(1)
@@ -1,24 +1,142 @@
 import os
+import tempfile
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 load_dotenv()
 
 here = os.path.dirname(os.path.abspath(__file__))
 
+BASE_URL = "https://adventofcode.com"
+DATA_DIR = os.path.join(here, "data")
+USER_AGENT = "aoc-2025 data_file.py (python-requests)"
+
+
+def make_session(token: str | None = None, pool_size: int = 8) -> requests.Session:
+    """Create a session carrying the AoC cookie, with room for pool_size parallel connections.
+
+    The token defaults to the AOC_SESSION environment variable (also read from .env).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.cookies.set("session", token if token is not None else os.environ["AOC_SESSION"])
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
 
 class DataFile:
-    def __init__(self, year: str, day: str):
-        self.create_directory(year)
+    """The input of one puzzle, downloaded to data/{year}/{day}.txt on creation.
+
+    An input that is already on disk is not requested again unless ``refresh`` is
+    set, in which case the request is conditional (If-Modified-Since the file's
+    mtime) and a 304 reply keeps the file as it is. Downloads are written to a
+    temporary file and renamed into place, so an interrupted run never leaves a
+    partial input behind. Error replies raise ``requests.HTTPError``.
+
+    Attributes:
+        path: Where the input is stored
+        downloaded: True if this call wrote the file, False if it was already current
+    """
+
+    def __init__(
+        self,
+        year: str,
+        day: str,
+        session: requests.Session | None = None,
+        refresh: bool = False,
+        base_url: str = BASE_URL,
+        data_dir: str = DATA_DIR,
+    ):
+        self.path = os.path.join(data_dir, str(year), f"{day}.txt")
+        self.downloaded = False
+
+        exists = os.path.exists(self.path)
+        if exists and not refresh:
+            return
+
+        self.create_directory(year, data_dir)
+
+        headers = {}
+        if exists:
+            headers["If-Modified-Since"] = formatdate(os.path.getmtime(self.path), usegmt=True)
 
-        cookie = {"session": os.environ["AOC_SESSION"]}
-        req = requests.get(f"https://adventofcode.com/{year}/day/{day}/input", cookies=cookie)
+        url = f"{base_url}/{year}/day/{day}/input"
+        if session is None:
+            with make_session(pool_size=1) as session:
+                response = session.get(url, headers=headers, timeout=30)
+        else:
+            response = session.get(url, headers=headers, timeout=30)
+        if response.status_code == 304:
+            return
+        response.raise_for_status()
 
-        with open(os.path.join(here, f"./data/{year}/{day}.txt"), "w") as f:
-            f.write(req.text)
+        self.write_atomic(response.content)
+        self.downloaded = True
+
+    def write_atomic(self, content: bytes) -> None:
+        """Write content to a temporary file next to path, then rename it over path."""
+        fd, temporary = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
 
     # create dir if not exists
-    def create_directory(self, year: str):
-        if not os.path.exists(os.path.join(here, f"./data/{year}")):
-            os.makedirs(os.path.join(here, f"./data/{year}"))
+    def create_directory(self, year: str, data_dir: str = DATA_DIR):
+        os.makedirs(os.path.join(data_dir, str(year)), exist_ok=True)
+
+
+def fetch_inputs(
+    puzzles: Iterable[tuple[str, str]],
+    workers: int = 8,
+    session: requests.Session | None = None,
+    refresh: bool = False,
+    base_url: str = BASE_URL,
+    data_dir: str = DATA_DIR,
+) -> list[DataFile]:
+    """Download many (year, day) inputs concurrently over one pooled session.
+
+    Inputs already on disk cost no request (see DataFile). The first error is
+    raised once the remaining downloads have finished; those that succeeded
+    are kept, so running again resumes where it stopped.
+
+    Args:
+        puzzles: The (year, day) pairs to fetch
+        workers: Maximum number of downloads in flight
+        session: Session to reuse (default: make_session(pool_size=workers))
+
+    Returns:
+        One DataFile per pair, in the order given
+
+    Example:
+        >>> fetch_inputs([("2025", day) for day in range(1, 13)])  # doctest: +SKIP
+    """
+    puzzles = list(puzzles)
+    missing = refresh or any(
+        not os.path.exists(os.path.join(data_dir, str(year), f"{day}.txt")) for year, day in puzzles
+    )
+    # Only ask for a token when something actually has to be downloaded
+    own_session = session is None and missing
+    if own_session:
+        session = make_session(pool_size=workers)
+
+    def fetch(puzzle: tuple[str, str]) -> DataFile:
+        year, day = puzzle
+        return DataFile(year, day, session, refresh, base_url, data_dir)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch, puzzles))
+    finally:
+        if own_session:
+            session.close()
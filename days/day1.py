@@ -1,4 +1,8 @@
-from data import get_input
+from array import array
+from collections.abc import Iterable
+from itertools import accumulate, islice
+
+from data import open_input
 
 
 def parse_line(line: str) -> list[int]:
@@ -8,33 +12,94 @@ def parse_line(line: str) -> list[int]:
 
 
 def move(line: str, position: int) -> tuple[int, int]:
+    """Rotate the dial and count how many clicks land on zero.
+
+    Computed arithmetically rather than click by click, so the cost does not
+    depend on the number of steps. Turning left from ``position`` is the mirror
+    image of turning right from ``-position``, so both directions reduce to
+    counting multiples of 100 passed on the way.
+
+    Args:
+        line: A rotation like "R60" or "L5"
+        position: Current dial position (0-99)
+
+    Returns:
+        A tuple of (new_position, zeroes) where zeroes is the number of clicks
+        that ended on 0
+
+    Example:
+        >>> move("R60", 95)
+        (55, 1)
+        >>> move("L1000000000", 50)
+        (50, 10000000)
+    """
     direction, steps = parse_line(line)
-    zeroes = 0
-    for _ in range(steps):
-        position += direction
-        position = position % 100
-        if position == 0:
-            zeroes += 1
+    zeroes = ((direction * position) % 100 + steps) // 100
+    return (position + direction * steps) % 100, zeroes
+
 
-    return position, zeroes
+def parse_steps(input: Iterable[str | bytes]) -> array | list[int]:
+    """Parse rotation lines into a compact array of signed step counts.
 
+    Right turns are positive and left turns negative, so the dial position after
+    each line is just a running sum of the array. Lines may be str or bytes. If
+    a step count doesn't fit in 64 bits, a list of Python ints is returned instead.
 
-def solve(input: list[str], count_all: bool = False) -> int:
-    position = 50
+    Example:
+        >>> parse_steps(["L68", "R48"])
+        array('q', [-68, 48])
+    """
+    steps = (int(line[1:]) if line[:1] in ("R", b"R") else -int(line[1:]) for line in input if line)
+    compact = array("q")
+    for step in steps:
+        try:
+            compact.append(step)
+        except OverflowError:
+            return [*compact, step, *steps]
+    return compact
+
+
+def solve_batch(input: Iterable[str | bytes], start: int = 50) -> tuple[int, int]:
+    """Answer both parts in a single pass over the rotations.
+
+    Works on the unwrapped running sum of the signed steps: every multiple of 100
+    passed between two consecutive sums is a click on zero, and a sum divisible
+    by 100 means the rotation ended on zero.
+
+    Args:
+        input: Rotation lines like "R60" or "L5"
+        start: Starting dial position (default: 50)
+
+    Returns:
+        A tuple of (zeroes, all_zeroes): rotations ending on 0 and total clicks on 0
+
+    Example:
+        >>> solve_batch(["L68", "L30", "R48"])
+        (1, 2)
+    """
     zeroes = 0
     all_zeroes = 0
-    for line in input:
-        position, count = move(line, position)
-        all_zeroes += count
-        if position == 0:
+    previous = start
+    for total in islice(accumulate(parse_steps(input), initial=start), 1, None):
+        if total >= previous:
+            all_zeroes += total // 100 - previous // 100
+        else:
+            all_zeroes += (previous - 1) // 100 - (total - 1) // 100
+        if total % 100 == 0:
             zeroes += 1
+        previous = total
+
+    return zeroes, all_zeroes
+
 
+def solve(input: Iterable[str | bytes], count_all: bool = False) -> int:
+    zeroes, all_zeroes = solve_batch(input)
     return all_zeroes if count_all else zeroes
 
 
 def main():
-    input = get_input("data/2025/1.txt")
-    zeroes = solve(input)
+    with open_input("data/2025/1.txt") as puzzle:
+        zeroes = solve(bytes(line) for line in puzzle.lines())
     print(zeroes)
 
 
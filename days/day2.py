@@ -1,8 +1,17 @@
-def parse_range(range_str: str) -> tuple[int, int]:
+import heapq
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from itertools import combinations, repeat
+from math import gcd
+
+
+def parse_range(range_str: str | bytes) -> tuple[int, int]:
     """Split a string on '-' and return two integers.
 
     Args:
-        range_str: A string like "1-5" or "10-20"
+        range_str: A string like "1-5" or "10-20" (or the same as bytes)
 
     Returns:
         A tuple of two integers (start, end)
@@ -13,12 +22,52 @@ def parse_range(range_str: str) -> tuple[int, int]:
         >>> parse_range("10-20")
         (10, 20)
     """
-    parts = range_str.split("-")
+    parts = range_str.split(b"-" if isinstance(range_str, bytes) else "-")
     if len(parts) != 2:
         raise ValueError(f"Expected format 'number-number', got '{range_str}'")
     return int(parts[0]), int(parts[1])
 
 
+def split_ranges(line: str) -> Iterator[str]:
+    """Lazily yield the comma-separated range strings in a line.
+
+    Unlike ``line.split(",")`` this never holds more than one range string at a
+    time, so very long input lines don't get copied into a list.
+
+    Args:
+        line: A string like "11-22,95-115"
+
+    Returns:
+        An iterator over the range strings, stripped of surrounding whitespace
+
+    Example:
+        >>> list(split_ranges("11-22,95-115"))
+        ['11-22', '95-115']
+    """
+    position = 0
+    while position <= len(line):
+        comma = line.find(",", position)
+        if comma == -1:
+            comma = len(line)
+        yield line[position:comma].strip()
+        position = comma + 1
+
+
+def id_range(start: int, end: int) -> range:
+    """Return a lazy range of integers from start to end (inclusive).
+
+    Example:
+        >>> list(id_range(1, 5))
+        [1, 2, 3, 4, 5]
+        >>> list(id_range(5, 1))
+        [5, 4, 3, 2, 1]
+    """
+    if start <= end:
+        return range(start, end + 1)
+    else:
+        return range(start, end - 1, -1)
+
+
 def range_list(start: int, end: int) -> list[int]:
     """Return a list of integers from start to end (inclusive).
 
@@ -37,10 +86,67 @@ def range_list(start: int, end: int) -> list[int]:
         >>> range_list(3, 3)
         [3]
     """
-    if start <= end:
-        return list(range(start, end + 1))
-    else:
-        return list(range(start, end - 1, -1))
+    return list(id_range(start, end))
+
+
+def _prime_factors(n: int) -> list[int]:
+    """Return the distinct prime factors of n in ascending order."""
+    factors = []
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            factors.append(factor)
+            while n % factor == 0:
+                n //= factor
+        factor += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+@cache
+def _candidate_periods(length: int, check_repeating: bool = False) -> tuple[int, ...]:
+    """Return the block lengths that can make a `length`-digit ID invalid.
+
+    Only the maximal proper divisors are returned: any ID that repeats with a
+    smaller period also repeats with one of these.
+
+    Example:
+        >>> _candidate_periods(12, check_repeating=True)
+        (6, 4)
+        >>> _candidate_periods(12)
+        (6,)
+    """
+    if check_repeating:
+        return tuple(length // factor for factor in _prime_factors(length))
+    return (length // 2,) if length % 2 == 0 else ()
+
+
+@cache
+def _period_multipliers(length: int, check_repeating: bool = False) -> tuple[int, ...]:
+    """Return 10^(length-p) + ... + 10^p + 1 for each candidate period p.
+
+    A `length`-digit number repeats with period p exactly when it is divisible
+    by the matching multiplier (the quotient is then the repeated block).
+
+    Example:
+        >>> _period_multipliers(6, check_repeating=True)
+        (1001, 10101)
+    """
+    return tuple(
+        (10**length - 1) // (10**period - 1)
+        for period in _candidate_periods(length, check_repeating)
+    )
+
+
+_POWERS_OF_TEN = [10**exponent for exponent in range(1, 40)]
+
+
+def _digit_count(id_num: int) -> int:
+    """Return the number of decimal digits in a non-negative integer without str()."""
+    if id_num < _POWERS_OF_TEN[-1]:
+        return bisect_right(_POWERS_OF_TEN, id_num) + 1
+    return len(str(id_num))
 
 
 def has_repeated_pattern(id_str: str) -> bool:
@@ -65,11 +171,9 @@ def has_repeated_pattern(id_str: str) -> bool:
     """
     length = len(id_str)
 
-    # Check all possible pattern lengths (excluding trivial cases)
-    for pattern_len in range(1, length // 2 + 1):
-        if length % pattern_len != 0:
-            continue
-
+    # Only the maximal proper divisors need checking: a pattern that repeats
+    # with a shorter length also repeats with one of these
+    for pattern_len in _candidate_periods(length, check_repeating=True):
         pattern = id_str[:pattern_len]
         num_repeats = length // pattern_len
 
@@ -80,6 +184,31 @@ def has_repeated_pattern(id_str: str) -> bool:
     return False
 
 
+def is_repeated_id(id_num: int, check_repeating: bool = True) -> bool:
+    """Numeric counterpart of ``has_repeated_pattern`` that never builds a string.
+
+    Args:
+        id_num: The non-negative ID to check
+        check_repeating: If True, any repeated pattern counts, otherwise only
+            IDs whose two halves match (the inverse of ``is_valid_id``)
+
+    Returns:
+        True if the ID is made of one block repeated
+
+    Example:
+        >>> is_repeated_id(123123123)
+        True
+        >>> is_repeated_id(123123123, check_repeating=False)
+        False
+        >>> is_repeated_id(1234)
+        False
+    """
+    for multiplier in _period_multipliers(_digit_count(id_num), check_repeating):
+        if id_num % multiplier == 0:
+            return True
+    return False
+
+
 def is_valid_id(id_num: int) -> bool:
     """Check if an ID is valid by comparing both halves of its string representation.
 
@@ -137,56 +266,236 @@ def process_range(range_str: str) -> list[int]:
     return range_list(start, end)
 
 
-def invalid_ids(numbers: list[int], check_repeating: bool = False) -> list[int]:
-    all_invalid_ids = []
+def scan_invalid_ids(numbers: Iterable[int], check_repeating: bool = False) -> Iterator[int]:
+    """Stream numbers through the validity check and yield the invalid ones.
+
+    Args:
+        numbers: Any iterable of IDs, e.g. ``id_range(start, end)``
+        check_repeating: If True, check for repeated patterns
+
+    Returns:
+        An iterator over the invalid IDs, in input order
 
+    Example:
+        >>> list(scan_invalid_ids(id_range(95, 115), check_repeating=True))
+        [99, 111]
+    """
     for num in numbers:
-        id_str = str(num)
-        is_invalid = False
+        if is_repeated_id(num, check_repeating):
+            yield num
+
+
+def invalid_ids(numbers: list[int], check_repeating: bool = False) -> list[int]:
+    return list(scan_invalid_ids(numbers, check_repeating))
+
+
+def _repeated_block_range(length: int, period: int, start: int, end: int) -> range:
+    """Return the `length`-digit IDs in [start, end] made of one repeated `period`-digit block.
+
+    Such IDs are block * (10^(length-period) + ... + 10^period + 1), so they form
+    an arithmetic progression whose step is that multiplier.
+
+    Example:
+        >>> list(_repeated_block_range(4, 2, 1000, 1300))
+        [1010, 1111, 1212]
+    """
+    multiplier = (10**length - 1) // (10**period - 1)
+    low = max(10 ** (period - 1), -(-start // multiplier))
+    high = min(10**period - 1, end // multiplier)
+    return range(low * multiplier, high * multiplier + 1, multiplier)
+
+
+def _digit_lengths(start: int, end: int) -> range:
+    return range(len(str(start)), len(str(end)) + 1)
+
 
-        # Check validity condition
-        if check_repeating:
-            # Invalid if it has a repeated pattern
-            is_invalid = has_repeated_pattern(id_str)
-        else:
-            # Invalid if halves are the same
-            is_invalid = not is_valid_id(id_str)
+def iter_invalid_ids(start: int, end: int, check_repeating: bool = False) -> Iterator[int]:
+    """Yield the invalid IDs in a range without visiting the valid ones.
 
-        if is_invalid:
-            all_invalid_ids.append(num)
-    return all_invalid_ids
+    For each digit length, the IDs built from each candidate period are merged
+    in ascending order and duplicates (IDs that repeat at several periods) are
+    dropped. Cost is proportional to the number of invalid IDs, not the width
+    of the range.
 
+    Args:
+        start: The starting number
+        end: The ending number (inclusive); the range may be given reversed
+        check_repeating: If True, any repeated pattern is invalid, otherwise
+            only IDs whose two halves match
+
+    Returns:
+        An iterator over the invalid IDs in ascending order
+
+    Example:
+        >>> list(iter_invalid_ids(95, 115, check_repeating=True))
+        [99, 111]
+        >>> list(iter_invalid_ids(95, 115))
+        [99]
+    """
+    start, end = min(start, end), max(start, end)
+    for length in _digit_lengths(start, end):
+        periods = _candidate_periods(length, check_repeating)
+        previous = None
+        for id_num in heapq.merge(
+            *(_repeated_block_range(length, period, start, end) for period in periods)
+        ):
+            if id_num != previous:
+                yield id_num
+                previous = id_num
+
+
+def sum_invalid_ids(start: int, end: int, check_repeating: bool = False) -> int:
+    """Return the sum of the invalid IDs in a range in closed form.
+
+    Each repeated-block progression is summed arithmetically, and IDs counted
+    under several periods are removed by inclusion-exclusion: the IDs repeating
+    at every period in a set are exactly those repeating at their gcd.
+
+    Args:
+        start: The starting number
+        end: The ending number (inclusive); the range may be given reversed
+        check_repeating: If True, any repeated pattern is invalid, otherwise
+            only IDs whose two halves match
+
+    Returns:
+        The sum of all invalid IDs in the range
 
-def solve(input_lines: list[str], check_repeating: bool = False) -> int:
+    Example:
+        >>> sum_invalid_ids(95, 115, check_repeating=True)
+        210
+        >>> sum_invalid_ids(1, 10**12)
+        495495540949540950
+    """
+    start, end = min(start, end), max(start, end)
+    total = 0
+    for length in _digit_lengths(start, end):
+        periods = _candidate_periods(length, check_repeating)
+        for size in range(1, len(periods) + 1):
+            sign = 1 if size % 2 else -1
+            for subset in combinations(periods, size):
+                ids = _repeated_block_range(length, gcd(*subset), start, end)
+                if ids:
+                    total += sign * (ids[0] + ids[-1]) * len(ids) // 2
+    return total
+
+
+def _split_range(start: int, end: int, max_width: int) -> Iterator[tuple[int, int]]:
+    """Split [start, end] into consecutive sub-ranges at most max_width wide."""
+    start, end = min(start, end), max(start, end)
+    while start <= end:
+        stop = min(end, start + max_width - 1)
+        yield start, stop
+        start = stop + 1
+
+
+def plan_chunks(ranges: list[tuple[int, int]], chunks: int) -> list[list[tuple[int, int]]]:
+    """Partition ranges into work chunks of roughly equal total width.
+
+    Ranges wider than an even share are first split into sub-ranges, so a single
+    giant range can't hold up the rest. Pieces are then handed out widest first
+    to whichever chunk is currently lightest. The plan only depends on the
+    input, so results reduce in the same order on every run.
+
+    Args:
+        ranges: List of (start, end) tuples; reversed ranges are allowed
+        chunks: Number of chunks to produce
+
+    Returns:
+        A list of chunks, each a list of (start, end) sub-ranges
+
+    Example:
+        >>> plan_chunks([(1, 100), (101, 110)], 2)
+        [[(1, 55)], [(56, 100), (101, 110)]]
+    """
+    total_width = sum(abs(end - start) + 1 for start, end in ranges)
+    max_width = max(1, -(-total_width // chunks))
+    pieces = [piece for start, end in ranges for piece in _split_range(start, end, max_width)]
+    pieces.sort(key=lambda piece: piece[0] - piece[1])
+
+    planned: list[list[tuple[int, int]]] = [[] for _ in range(chunks)]
+    heap = [(0, index) for index in range(chunks)]
+    for start, end in pieces:
+        width, index = heapq.heappop(heap)
+        planned[index].append((start, end))
+        heapq.heappush(heap, (width + end - start + 1, index))
+
+    for chunk in planned:
+        chunk.sort()
+    return [chunk for chunk in planned if chunk]
+
+
+def _sum_chunk(chunk: list[tuple[int, int]], check_repeating: bool) -> int:
+    return sum(sum_invalid_ids(start, end, check_repeating) for start, end in chunk)
+
+
+def solve_ranges(
+    ranges: Iterable[tuple[int, int]], check_repeating: bool = False, workers: int = 1
+) -> int:
+    """Return the sum of all invalid IDs in already parsed (start, end) ranges.
+
+    See ``solve`` for the meaning of ``check_repeating`` and ``workers``.
+
+    Example:
+        >>> solve_ranges([(1212, 1214), (1234, 1236)])
+        1212
+    """
+    if workers > 1:
+        chunks = plan_chunks(list(ranges), workers * 4)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return sum(executor.map(_sum_chunk, chunks, repeat(check_repeating)))
+
+    return sum(sum_invalid_ids(start, end, check_repeating) for start, end in ranges)
+
+
+def solve(input_lines: Iterable[str], check_repeating: bool = False, workers: int = 1) -> int:
     """Process input lines and return the sum of all invalid IDs.
 
+    Ranges are consumed one at a time and only a running total is kept, so
+    ``input_lines`` can be a lazy iterator such as ``split_ranges(line)``.
+
+    With ``workers`` greater than one the ranges are collected, balanced into
+    chunks by width (see ``plan_chunks``) and summed in a process pool. Partial
+    sums are added in chunk order.
+
     Args:
-        input_lines: List of range strings like ["1-5", "10-20"]
+        input_lines: Range strings like ["1-5", "10-20"]
         check_repeating: If True, check for repeated patterns
-        check_halves: If True, check if halves are the same (default True)
+        workers: Number of worker processes (default: 1, no pool)
 
     Returns:
         The sum of all invalid IDs found across all ranges
 
     Example:
         >>> solve(["1212-1214", "1234-1236"])
-        3702
+        1212
     """
-    all_invalid_ids = []
+    # Skip empty lines
+    ranges = (parse_range(line.strip()) for line in input_lines if line.strip())
+    return solve_ranges(ranges, check_repeating, workers)
+
+
+PARSE_VERSION = 2
 
-    for line in input_lines:
-        if line.strip():  # Skip empty lines
-            all_invalid_ids.extend(invalid_ids(process_range(line.strip()), check_repeating))
 
-    return sum(all_invalid_ids)
+def parse_input(lines: Iterable[str | bytes | memoryview]) -> list[tuple[int, int]]:
+    """Parse the comma-separated ranges on the first input line.
+
+    Example:
+        >>> parse_input([b"11-22,95-115"])
+        [(11, 22), (95, 115)]
+    """
+    line = next(iter(lines), "")
+    if not isinstance(line, str):
+        line = bytes(line).decode()
+    return [parse_range(piece) for piece in split_ranges(line) if piece]
 
 
 def main():
-    from data import get_input
+    from data import parse_cached
 
-    input_lines = get_input("data/2025/2.txt")
-    total = solve(input_lines[0].split(","))
-    total_repeating = solve(input_lines[0].split(","), check_repeating=True)
+    ranges = parse_cached("data/2025/2.txt", parse_input, PARSE_VERSION)
+    total = solve_ranges(ranges)
+    total_repeating = solve_ranges(ranges, check_repeating=True)
     print(total)
     print(total_repeating)
 
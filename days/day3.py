@@ -1,3 +1,7 @@
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, MutableSequence, Sequence
+
+
 def string_to_ints(s: str) -> list[int]:
     """Convert a string into a list of integers.
 
@@ -21,8 +25,8 @@ def string_to_ints(s: str) -> list[int]:
 def highest_number(digits: list[int], n: int = 2) -> int:
     """Return the highest possible n-digit number from a list of single-digit integers.
 
-    Finds all possible n-digit numbers by selecting n digits in their original order,
-    and returns the highest one.
+    Selects n digits in their original order so that the resulting number is as
+    large as possible, in O(len(digits)) time.
 
     Args:
         digits: A list of single-digit integers (0-9)
@@ -44,37 +48,105 @@ def highest_number(digits: list[int], n: int = 2) -> int:
     if len(digits) < n:
         return 0
 
-    max_num = 0  # Cache the highest number we've seen
+    result = 0
+    for digit in _select_highest(digits, n, []):
+        result = result * 10 + digit
+    return result
+
+
+def highest_number_bytes(bank: bytes | memoryview, n: int = 2) -> int:
+    """Return the highest n-digit number from a bank of ASCII digits.
+
+    Same selection as ``highest_number`` but works directly on the raw bytes:
+    ASCII digits compare in the same order as their values, and each digit's
+    value is its byte minus 48, so no per-digit int list is built.
+
+    Args:
+        bank: ASCII digit bytes such as b"5192" (or a memoryview of them)
+        n: The number of digits in the number to find (default: 2)
+
+    Returns:
+        The highest n-digit number that can be formed
+
+    Example:
+        >>> highest_number_bytes(b"5192")
+        92
+    """
+    if len(bank) < n:
+        return 0
+
+    result = 0
+    for byte in _select_highest(bank, n, bytearray()):
+        result = result * 10 + byte - 48
+    return result
+
+
+def _select_highest(
+    digits: Sequence[int], n: int, stack: MutableSequence[int]
+) -> MutableSequence[int]:
+    """Select the n digits that form the largest number, keeping their order.
+
+    Greedy monotonic stack: a digit is dropped whenever a larger one follows it
+    and we can still afford to drop digits, which keeps the kept sequence
+    lexicographically largest. Each digit is pushed and popped at most once.
+    """
+    drops_left = len(digits) - n
+    for digit in digits:
+        while drops_left and stack and stack[-1] < digit:
+            stack.pop()
+            drops_left -= 1
+        stack.append(digit)
+    del stack[n:]
+    return stack
 
-    # Use iterative approach with a stack to avoid recursion overhead
-    # Stack stores (start_index, current_number, digits_used)
-    stack = [(0, 0, 0)]
 
-    while stack:
-        start_idx, current_num, digits_used = stack.pop()
+def digit_positions(bank: bytes | memoryview) -> list[list[int]]:
+    """Index a bank of ASCII digits by listing where each digit value occurs.
 
-        if digits_used == n:
-            # We've built a complete number, update max
-            max_num = max(max_num, current_num)
-        else:
-            # Check if this branch could potentially beat max_num
-            # Calculate the maximum possible number we could form from here
-            remaining = n - digits_used
-            # Best case: fill remaining digits with 9s
-            max_possible = current_num
-            for _ in range(remaining):
-                max_possible = max_possible * 10 + 9
+    Example:
+        >>> digit_positions(b"5192")[9]
+        [2]
+    """
+    positions: list[list[int]] = [[] for _ in range(10)]
+    for index, byte in enumerate(bank):
+        positions[byte - 48].append(index)
+    return positions
 
-            # If even the best case can't beat max_num, skip this branch
-            if max_possible <= max_num:
-                continue
 
-            # Continue building the number
-            for i in range(start_idx, len(digits) - remaining + 1):
-                new_num = current_num * 10 + digits[i]
-                stack.append((i + 1, new_num, digits_used + 1))
+def highest_number_from_positions(positions: list[list[int]], length: int, n: int = 2) -> int:
+    """Return the highest n-digit number using a ``digit_positions`` index.
+
+    Each output digit is the largest digit that occurs inside the window still
+    allowed for it, found by binary search in that digit's position list. This
+    costs O(n * 10 * log(length)) per query, so one index serves many values of n.
+
+    Args:
+        positions: Output of ``digit_positions`` for the bank
+        length: Number of digits in the bank
+        n: The number of digits in the number to find (default: 2)
+
+    Returns:
+        The highest n-digit number that can be formed
+
+    Example:
+        >>> highest_number_from_positions(digit_positions(b"5192"), 4)
+        92
+    """
+    if length < n:
+        return 0
 
-    return max_num
+    result = 0
+    start = 0
+    for remaining in range(n, 0, -1):
+        last = length - remaining
+        for digit in range(9, -1, -1):
+            occurrences = positions[digit]
+            found = bisect_left(occurrences, start)
+            if found < len(occurrences) and occurrences[found] <= last:
+                result = result * 10 + digit
+                start = occurrences[found] + 1
+                break
+    return result
 
 
 def solve(input_lines: list[str], n: int = 2) -> int:
@@ -95,20 +167,93 @@ def solve(input_lines: list[str], n: int = 2) -> int:
     """
     total = 0
     for line in input_lines:
-        if line.strip():
-            digits = string_to_ints(line.strip())
-            total += highest_number(digits, n)
+        line = line.strip()
+        if line:
+            total += highest_number(string_to_ints(line), n)
     return total
 
 
+def iter_banks(data: bytes) -> Iterator[memoryview]:
+    """Yield each non-empty line of raw input as a zero-copy memoryview.
+
+    Trailing carriage returns are excluded from the views.
+
+    Example:
+        >>> [bytes(bank) for bank in iter_banks(b"123\\r\\n\\n5192\\n")]
+        [b'123', b'5192']
+    """
+    view = memoryview(data)
+    start = 0
+    length = len(data)
+    while start < length:
+        end = data.find(b"\n", start)
+        if end == -1:
+            end = length
+        stop = end
+        while stop > start and data[stop - 1] in b"\r ":
+            stop -= 1
+        if stop > start:
+            yield view[start:stop]
+        start = end + 1
+
+
+def solve_bytes(data: bytes, n: int = 2) -> int:
+    """Sum the highest n-digit numbers of every bank in raw input bytes.
+
+    Args:
+        data: The whole input as bytes, one bank per line
+
+    Returns:
+        The sum of the highest n-digit number of each bank
+
+    Example:
+        >>> solve_bytes(b"123\\n5192\\n")
+        115
+    """
+    return sum(highest_number_bytes(bank, n) for bank in iter_banks(data))
+
+
+def solve_many(
+    input_lines: Iterable[str | bytes | memoryview], ns: Iterable[int] = (2, 12)
+) -> dict[int, int]:
+    """Answer several digit counts in one pass over the banks.
+
+    Each bank is indexed once with ``digit_positions`` and every requested n is
+    then answered from that index.
+
+    Args:
+        input_lines: Banks as strings or bytes (surrounding whitespace is stripped),
+            or as memoryviews already trimmed, such as those from ``iter_banks``
+        ns: The digit counts to compute (default: 2 and 12)
+
+    Returns:
+        A dict mapping each n to the sum of the highest n-digit numbers
+
+    Example:
+        >>> solve_many(["123", "5192"], ns=[2, 3])
+        {2: 115, 3: 715}
+    """
+    totals = dict.fromkeys(ns, 0)
+    for bank in input_lines:
+        if isinstance(bank, str):
+            bank = bank.strip().encode()
+        elif isinstance(bank, bytes):
+            bank = bank.strip()
+        if not bank:
+            continue
+        positions = digit_positions(bank)
+        for n in totals:
+            totals[n] += highest_number_from_positions(positions, len(bank), n)
+    return totals
+
+
 def main():
-    from data import get_input
+    from data import open_input
 
-    input_lines = get_input("data/2025/3.txt")
-    total = solve(input_lines)
-    total_12 = solve(input_lines, n=12)
-    print(total)
-    print(total_12)
+    with open_input("data/2025/3.txt") as puzzle:
+        totals = solve_many(iter_banks(puzzle.data), ns=(2, 12))
+    print(totals[2])
+    print(totals[12])
 
 
 if __name__ == "__main__":
@@ -1,4 +1,90 @@
+import copy
 import re
+from array import array
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from itertools import pairwise
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, see solve_numpy
+    np = None
+
+# Offsets of the 8 neighbours (up, down, left, right, and 4 diagonals)
+DIRECTIONS = (
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+)
+
+# A kernel is a tuple of (row, col) offsets around a cell
+Kernel = tuple[tuple[int, int], ...]
+
+MOORE: Kernel = DIRECTIONS
+VON_NEUMANN: Kernel = ((-1, 0), (0, -1), (0, 1), (1, 0))
+
+
+def radius_kernel(radius: int) -> Kernel:
+    """Return the Moore neighbourhood of the given radius, excluding the cell itself.
+
+    Example:
+        >>> radius_kernel(1) == MOORE
+        True
+        >>> len(radius_kernel(2))
+        24
+    """
+    return tuple(
+        (dr, dc)
+        for dr in range(-radius, radius + 1)
+        for dc in range(-radius, radius + 1)
+        if (dr, dc) != (0, 0)
+    )
+
+
+def kernel_radius(kernel: Kernel) -> int:
+    """Return how far (in rows or columns) a kernel reaches from its centre."""
+    return max((max(abs(dr), abs(dc)) for dr, dc in kernel), default=0)
+
+
+@cache
+def flat_offsets(kernel: Kernel, stride: int) -> tuple[int, ...]:
+    """Translate a kernel into flat offsets for a packed grid of the given stride."""
+    return tuple(dr * stride + dc for dr, dc in kernel)
+
+
+def split_grid_lines(s: str, sep: str | re.Pattern[str] = "\n") -> list[str]:
+    """Split a string into its non-empty grid rows, as used by string_to_grid.
+
+    Example:
+        >>> split_grid_lines("ABC\\r\\nDEF\\n")
+        ['ABC', 'DEF']
+    """
+    if not s:
+        return []
+
+    # Normalize line endings - replace \r\n with \n, then \r with \n
+    normalized = s.replace("\r\n", "\n").replace("\r", "\n")
+
+    # Split on the separator (string or regex pattern)
+    if isinstance(sep, re.Pattern):
+        # Use regex to split
+        lines = sep.split(normalized)
+    elif sep == "\n":
+        lines = normalized.split("\n")
+    else:
+        lines = normalized.split(sep)
+
+    # Filter out empty lines
+    return [line for line in lines if line]
 
 
 def string_to_grid(s: str, sep: str | re.Pattern[str] = "\n") -> list[list[str]]:
@@ -23,37 +109,186 @@ def string_to_grid(s: str, sep: str | re.Pattern[str] = "\n") -> list[list[str]]
         >>> string_to_grid("A  B  C", sep=re.compile(r"\\s+"))
         [['A'], ['B'], ['C']]
     """
-    if not s:
-        return []
+    # Convert each line to a list of characters
+    return [list(line) for line in split_grid_lines(s, sep)]
 
-    # Normalize line endings - replace \r\n with \n, then \r with \n
-    normalized = s.replace("\r\n", "\n").replace("\r", "\n")
 
-    # Split on the separator (string or regex pattern)
-    if isinstance(sep, re.Pattern):
-        # Use regex to split
-        lines = sep.split(normalized)
-    elif sep == "\n":
-        lines = normalized.split("\n")
-    else:
-        lines = normalized.split(sep)
+def _encode_row(line: str) -> bytes:
+    """Encode a grid row one byte per character; characters beyond latin-1 become NUL."""
+    try:
+        return line.encode("latin-1")
+    except UnicodeEncodeError:
+        return bytes(code if code < 256 else 0 for code in map(ord, line))
+
 
-    # Filter out empty lines and convert each line to a list of characters
-    return [list(line) for line in lines if line]
+class PackedGrid:
+    """A character grid packed into one bytearray with a padded border.
 
+    Row r, column c lives at flat index (r + padding) * stride + (c + padding),
+    where stride is the widest row plus twice the padding (one cell by default).
+    Padding (the border and the tail of short rows in a jagged grid) holds a
+    NUL byte, so neighbour lookups for any kernel that reaches no further than
+    the padding are fixed flat offsets that never need bounds checks. Each cell
+    costs one byte. Characters outside latin-1 are stored as NUL too, so they
+    never match a target character and read back as "\\0".
 
-def count_adjacent(grid: list[list[str]], row: int, col: int, char: str) -> int:
+    Whole-grid neighbour counts from ``neighbour_counts`` are cached per kernel
+    and character until the grid is changed. Code that writes to ``cells``
+    directly must call ``invalidate`` afterwards; ``grid[row, col] = char``
+    does so itself.
+
+    Example:
+        >>> grid = PackedGrid.from_string("ABC\\nDE")
+        >>> grid[1, 1], grid.contains(1, 2)
+        ('E', False)
+    """
+
+    def __init__(self, lines: Sequence[str | bytes | memoryview], padding: int = 1):
+        if padding < kernel_radius(DIRECTIONS):
+            raise ValueError(
+                f"Grid padding {padding} is smaller than the neighbour radius "
+                f"{kernel_radius(DIRECTIONS)}"
+            )
+        self.row_lengths = [len(line) for line in lines]
+        self.padding = padding
+        self.width = max(self.row_lengths, default=0)
+        self.stride = self.width + 2 * padding
+        self.cells = bytearray((len(lines) + 2 * padding) * self.stride)
+        for row, line in enumerate(lines):
+            start = self.index(row, 0)
+            self.cells[start : start + len(line)] = (
+                _encode_row(line) if isinstance(line, str) else line
+            )
+        self.offsets = flat_offsets(DIRECTIONS, self.stride)
+        self._counts: dict[tuple[Kernel, str], memoryview] = {}
+
+    @classmethod
+    def from_string(
+        cls, s: str, sep: str | re.Pattern[str] = "\n", padding: int = 1
+    ) -> "PackedGrid":
+        """Build a grid the same way string_to_grid splits its input."""
+        return cls(split_grid_lines(s, sep), padding)
+
+    @classmethod
+    def from_lines(
+        cls, lines: Iterable[str | bytes | memoryview], padding: int = 1
+    ) -> "PackedGrid":
+        """Build a grid from already split rows, such as MappedInput.lines, skipping empty ones."""
+        return cls([line for line in lines if line], padding)
+
+    def copy(self) -> "PackedGrid":
+        """Return an independent copy of the grid."""
+        grid = copy.copy(self)
+        grid.row_lengths = list(self.row_lengths)
+        grid.cells = bytearray(self.cells)
+        grid._counts = {}
+        return grid
+
+    def __getstate__(self) -> dict:
+        # The cached counts are memoryviews, which can't be pickled
+        return {**self.__dict__, "_counts": {}}
+
+    def __len__(self) -> int:
+        return len(self.row_lengths)
+
+    def __getitem__(self, position: tuple[int, int]) -> str:
+        return chr(self.cells[self.index(*position)])
+
+    def __setitem__(self, position: tuple[int, int], char: str) -> None:
+        self.cells[self.index(*position)] = ord(char)
+        self.invalidate()
+
+    def index(self, row: int, col: int) -> int:
+        """Return the flat index of a cell."""
+        return (row + self.padding) * self.stride + col + self.padding
+
+    def position(self, index: int) -> tuple[int, int]:
+        """Return the (row, col) of a flat index."""
+        row, col = divmod(index, self.stride)
+        return row - self.padding, col - self.padding
+
+    def contains(self, row: int, col: int) -> bool:
+        """Return True if (row, col) is a cell of the (possibly jagged) grid."""
+        return 0 <= row < len(self.row_lengths) and 0 <= col < self.row_lengths[row]
+
+    def kernel_offsets(self, kernel: Kernel) -> tuple[int, ...]:
+        """Return the flat offsets of a kernel, checking it fits in the padding."""
+        kernel = tuple(kernel)
+        if kernel_radius(kernel) > self.padding:
+            raise ValueError(
+                f"Kernel radius {kernel_radius(kernel)} exceeds grid padding {self.padding}"
+            )
+        return flat_offsets(kernel, self.stride)
+
+    def count_at(self, index: int, value: int, kernel: Kernel = DIRECTIONS) -> int:
+        """Count the neighbours of a flat index holding the byte value."""
+        cells = self.cells
+        offsets = self.offsets if kernel is DIRECTIONS else self.kernel_offsets(kernel)
+        return sum(1 for offset in offsets if cells[index + offset] == value)
+
+    def neighbour_counts(self, char: str, kernel: Kernel = DIRECTIONS) -> memoryview:
+        """Count `char` around every cell of the grid in one pass.
+
+        Each occurrence of `char` adds one to every cell whose kernel reaches it,
+        so the work is O(occurrences * kernel size) instead of rechecking each
+        cell's neighbourhood. The result is cached until the grid is changed.
+
+        Args:
+            char: Character to count
+            kernel: Neighbour offsets (default: the 8-cell Moore neighbourhood)
+
+        Returns:
+            A read-only view of the counts, indexed by flat index like ``cells``
+            (entries for padding are meaningless)
+
+        Example:
+            >>> grid = PackedGrid.from_string("@@\\n@.")
+            >>> counts = grid.neighbour_counts("@", VON_NEUMANN)
+            >>> counts[grid.index(1, 1)], counts[grid.index(0, 0)]
+            (2, 2)
+        """
+        kernel = tuple(kernel)
+        key = (kernel, char)
+        if key not in self._counts:
+            offsets = self.kernel_offsets(kernel)
+            # Counts can't exceed the kernel size, so small kernels fit in a byte
+            counts = array("B" if len(kernel) < 256 else "I", [0]) * len(self.cells)
+            value = ord(char)
+            occurrences = [index for index, cell in enumerate(self.cells) if cell == value]
+            for offset in offsets:
+                for index in occurrences:
+                    counts[index - offset] += 1
+            self._counts[key] = memoryview(counts).toreadonly()
+        return self._counts[key]
+
+    def invalidate(self) -> None:
+        """Drop cached neighbour counts after the cells have been changed."""
+        self._counts.clear()
+
+    def to_lists(self) -> list[list[str]]:
+        """Unpack into the list-of-lists form returned by string_to_grid."""
+        return [
+            [self[row, col] for col in range(length)] for row, length in enumerate(self.row_lengths)
+        ]
+
+
+def count_adjacent(
+    grid: list[list[str]] | PackedGrid, row: int, col: int, char: str, kernel: Kernel = DIRECTIONS
+) -> int:
     """Count adjacent positions matching a specific character.
 
     Checks all 8 adjacent positions (up, down, left, right, and 4 diagonals)
-    around the given coordinate and returns the count of matching characters.
-    Handles jagged arrays (rows of different lengths).
+    around the given coordinate, or the offsets of another kernel, and returns
+    the count of matching characters. Handles jagged arrays (rows of different
+    lengths).
 
     Args:
-        grid: A grid represented as a list of lists of strings (may be jagged)
+        grid: A grid represented as a list of lists of strings (may be jagged),
+            or a PackedGrid
         row: Row index (0-based)
         col: Column index (0-based)
         char: Character to search for in adjacent positions
+        kernel: Offsets to check (default: the 8 adjacent positions)
 
     Returns:
         The count of adjacent positions matching the character
@@ -63,6 +298,11 @@ def count_adjacent(grid: list[list[str]], row: int, col: int, char: str) -> int:
         >>> count_adjacent(grid, 1, 1, 'A')
         1
     """
+    if isinstance(grid, PackedGrid):
+        if not grid.contains(row, col):
+            return 0
+        return grid.count_at(grid.index(row, col), ord(char), kernel)
+
     if not grid or row < 0 or col < 0:
         return 0
 
@@ -71,18 +311,7 @@ def count_adjacent(grid: list[list[str]], row: int, col: int, char: str) -> int:
         return 0
 
     count = 0
-    directions = [
-        (-1, -1),
-        (-1, 0),
-        (-1, 1),
-        (0, -1),
-        (0, 1),
-        (1, -1),
-        (1, 0),
-        (1, 1),
-    ]
-
-    for dr, dc in directions:
+    for dr, dc in kernel:
         new_row = row + dr
         new_col = col + dc
 
@@ -93,7 +322,14 @@ def count_adjacent(grid: list[list[str]], row: int, col: int, char: str) -> int:
     return count
 
 
-def check_adjacent(grid: list[list[str]], row: int, col: int, char: str, n: int) -> bool:
+def check_adjacent(
+    grid: list[list[str]] | PackedGrid,
+    row: int,
+    col: int,
+    char: str,
+    n: int,
+    kernel: Kernel = DIRECTIONS,
+) -> bool:
     """Check adjacent positions for a specific character.
 
     Checks all 8 adjacent positions (up, down, left, right, and 4 diagonals)
@@ -102,11 +338,13 @@ def check_adjacent(grid: list[list[str]], row: int, col: int, char: str, n: int)
     Handles jagged arrays (rows of different lengths).
 
     Args:
-        grid: A grid represented as a list of lists of strings (may be jagged)
+        grid: A grid represented as a list of lists of strings (may be jagged),
+            or a PackedGrid
         row: Row index (0-based)
         col: Column index (0-based)
         char: Character to search for in adjacent positions
         n: Threshold - returns True if count < n
+        kernel: Offsets to check (default: the 8 adjacent positions)
 
     Returns:
         True if there are less than n occurrences of char in adjacent positions
@@ -118,67 +356,286 @@ def check_adjacent(grid: list[list[str]], row: int, col: int, char: str, n: int)
         >>> check_adjacent(grid, 0, 0, 'B', 1)
         False
     """
-    if not grid or row < 0 or col < 0:
+    if isinstance(grid, PackedGrid):
+        if not grid.contains(row, col):
+            return False
+    elif not grid or row < 0 or col < 0 or row >= len(grid) or col >= len(grid[row]):
         return False
 
-    rows = len(grid)
-    if row >= rows or col >= len(grid[row]):
-        return False
-
-    count = count_adjacent(grid, row, col, char)
+    count = count_adjacent(grid, row, col, char, kernel)
     result = count < n
     if result:
-        grid[row][col] = "x"
+        if isinstance(grid, PackedGrid):
+            grid[row, col] = "x"
+        else:
+            grid[row][col] = "x"
     return result
 
 
-def solve(input_str: str, iterate_until_stable: bool = False) -> int:
+def peel_until_stable(grid: list[list[str]] | PackedGrid, char: str = "@", n: int = 4) -> int:
+    """Repeatedly remove `char` cells with fewer than n `char` neighbours.
+
+    Worklist version of rescanning the grid until nothing changes: neighbour
+    counts are computed once, and removing a cell only decrements its own
+    neighbours, queueing those that drop below the threshold. Removal never
+    raises a count, so the order doesn't change which cells end up removed and
+    the total work is O(cells). Removed cells are marked 'x'.
+
+    Args:
+        grid: A grid represented as a list of lists of strings (may be jagged),
+            or a PackedGrid
+        char: The character of the cells to peel (default: '@')
+        n: Threshold - cells with fewer than n matching neighbours are removed
+
+    Returns:
+        The number of cells removed
+
+    Example:
+        >>> grid = string_to_grid("@@@\\n@@@")
+        >>> peel_until_stable(grid)
+        6
+    """
+    if not isinstance(grid, PackedGrid):
+        packed = PackedGrid(["".join(row) for row in grid])
+        removed = peel_until_stable(packed, char, n)
+        grid[:] = packed.to_lists()
+        return removed
+
+    cells = grid.cells
+    offsets = grid.offsets
+    value = ord(char)
+    marker = ord("x")
+
+    # Neighbour counts fit in a byte, one per cell like the grid itself
+    counts = bytearray(grid.neighbour_counts(char))
+    queue: deque[int] = deque(
+        index for index, cell in enumerate(cells) if cell == value and counts[index] < n
+    )
+
+    removed = 0
+    while queue:
+        index = queue.popleft()
+        cells[index] = marker
+        removed += 1
+        for offset in offsets:
+            neighbour = index + offset
+            if cells[neighbour] == value:
+                counts[neighbour] -= 1
+                # Queue each cell only once, when it first drops below n
+                if counts[neighbour] == n - 1:
+                    queue.append(neighbour)
+
+    grid.invalidate()
+    return removed
+
+
+def solve(input_str: str | PackedGrid, iterate_until_stable: bool = False, workers: int = 1) -> int:
     """Solve the puzzle by checking adjacent positions in the grid.
 
     Converts the input string to a grid and counts '@' positions that have
     less than 4 adjacent '@' characters. Marks matching positions as 'x'.
 
+    Args:
+        input_str: Input string representing the grid, or an already packed grid
+            (which is marked in place)
+        iterate_until_stable: If True, keep removing positions until none are
+            left with less than 4 adjacent '@' characters (see peel_until_stable)
+        workers: Number of worker processes; above 1 the grid is split into
+            strips and solved in parallel (see solve_strips)
+
+    Returns:
+        The count of '@' positions with less than 4 adjacent '@' characters
+    """
+    grid = input_str if isinstance(input_str, PackedGrid) else PackedGrid.from_string(input_str)
+    if workers > 1:
+        return solve_strips(grid, iterate_until_stable, workers)
+    if iterate_until_stable:
+        return peel_until_stable(grid)
+
+    cells = grid.cells
+    roll = ord("@")
+    counts = grid.neighbour_counts("@")
+
+    # Collect positions to mark first (don't modify grid during check)
+    positions_to_mark = [
+        index for index, cell in enumerate(cells) if cell == roll and counts[index] < 4
+    ]
+
+    # Mark all positions at once
+    for index in positions_to_mark:
+        cells[index] = ord("x")
+    grid.invalidate()
+
+    return len(positions_to_mark)
+
+
+# Per-process state for solve_strips workers, set up once by _attach_strip_worker
+_strip_worker: dict = {}
+
+
+def _attach_strip_worker(name: str, stride: int) -> None:
+    grid = shared_memory.SharedMemory(name=name, track=False)
+    _strip_worker["grid"] = grid
+    _strip_worker["offsets"] = tuple(dr * stride + dc for dr, dc in DIRECTIONS)
+
+
+def _strip_removals(low: int, high: int, removed_nearby: list[int] | None) -> list[int]:
+    """Return the flat indices in [low, high) of rolls with less than 4 neighbours.
+
+    On the first round every cell of the strip is checked. Afterwards only the
+    neighbours of the previous round's removals (in the strip and its one-row
+    halo) can have changed, so only those are rechecked.
+    """
+    cells = _strip_worker["grid"].buf
+    offsets = _strip_worker["offsets"]
+    roll = ord("@")
+
+    if removed_nearby is None:
+        candidates = range(low, high)
+    else:
+        candidates = sorted(
+            {
+                index + offset
+                for index in removed_nearby
+                for offset in offsets
+                if low <= index + offset < high
+            }
+        )
+
+    return [
+        index
+        for index in candidates
+        if cells[index] == roll
+        and sum(1 for offset in offsets if cells[index + offset] == roll) < 4
+    ]
+
+
+def solve_strips(grid: PackedGrid, iterate_until_stable: bool = False, workers: int = 2) -> int:
+    """Solve the puzzle in parallel over horizontal strips of the grid.
+
+    The packed grid is copied once into shared memory, and each worker process
+    owns a band of rows, reading the row above and below it as a halo. Each
+    round, every strip reports the rolls it would remove. Once all strips have
+    reported, the removals are written to the shared grid, and each strip is
+    sent the removals from its own rows and its halo. The next round
+    re-checks only their neighbours. Solving stops once no strip removes
+    anything, so the result matches the serial round-by-round solver. The
+    final shared grid is copied back, so ``grid`` ends up marked exactly as
+    the serial path in ``solve`` would leave it.
+
+    Args:
+        grid: The packed puzzle grid, marked in place
+        iterate_until_stable: If True, keep removing rounds of positions until
+            none are left with less than 4 adjacent '@' characters
+        workers: Number of worker processes and strips
+
+    Returns:
+        The count of '@' positions with less than 4 adjacent '@' characters
+    """
+    rows = len(grid)
+    if not rows:
+        return 0
+
+    stride = grid.stride
+    strips = min(workers, rows)
+    bounds = [rows * strip // strips for strip in range(strips + 1)]
+    # Flat index ranges of each strip's own rows, and of those rows plus the halo
+    padding = grid.padding
+    owned = [
+        ((first + padding) * stride, (last + padding) * stride) for first, last in pairwise(bounds)
+    ]
+    with_halo = [(low - stride, high + stride) for low, high in owned]
+
+    shared = shared_memory.SharedMemory(create=True, size=len(grid.cells))
+    try:
+        shared.buf[: len(grid.cells)] = grid.cells
+        with ProcessPoolExecutor(
+            max_workers=strips,
+            initializer=_attach_strip_worker,
+            initargs=(shared.name, stride),
+        ) as executor:
+            nearby: list[list[int] | None] = [None] * strips
+            total_count = 0
+            while True:
+                futures = [
+                    executor.submit(_strip_removals, low, high, nearby[strip])
+                    for strip, (low, high) in enumerate(owned)
+                ]
+                # Strips are in row order, so the concatenation stays sorted
+                removed = [index for future in futures for index in future.result()]
+                for index in removed:
+                    shared.buf[index] = ord("x")
+
+                total_count += len(removed)
+                if not iterate_until_stable or not removed:
+                    grid.cells[:] = shared.buf[: len(grid.cells)]
+                    grid.invalidate()
+                    return total_count
+
+                nearby = [
+                    removed[bisect_left(removed, low) : bisect_left(removed, high)]
+                    for low, high in with_halo
+                ]
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def solve_numpy(input_str: str, iterate_until_stable: bool = False) -> int:
+    """Solve the puzzle with NumPy, counting every cell's neighbours at once.
+
+    The packed grid's bytes are viewed as a 2D array, and the neighbour counts
+    are the sum of the eight shifted copies of the '@' mask. The padded
+    border keeps every shift in bounds. Each round then removes all rolls with
+    less than 4 neighbours in bulk. Gives the same answers as ``solve``, and
+    falls back to it when NumPy is not installed.
+
     Args:
         input_str: Input string representing the grid
-        iterate_until_stable: If True, continue iterating until no new positions
-            are marked in an iteration
+        iterate_until_stable: If True, keep removing rounds of positions until
+            none are left with less than 4 adjacent '@' characters
 
     Returns:
         The count of '@' positions with less than 4 adjacent '@' characters
     """
-    grid = string_to_grid(input_str)
-    total_count = 0
+    if np is None:
+        return solve(input_str, iterate_until_stable)
 
+    grid = PackedGrid.from_string(input_str)
+    rows = len(grid)
+    stride = grid.stride
+    rolls = np.frombuffer(grid.cells, dtype=np.uint8).reshape(rows + 2, stride) == ord("@")
+    inner = rolls[1:-1, 1:-1]
+    counts = np.empty(inner.shape, dtype=np.uint8)
+
+    total_count = 0
     while True:
-        # Collect positions to mark first (don't modify grid during check)
-        positions_to_mark = []
-        for row in range(len(grid)):
-            for col in range(len(grid[row])):
-                if grid[row][col] == "@":
-                    # Use count_adjacent helper to check if position should be marked
-                    if count_adjacent(grid, row, col, "@") < 4:
-                        positions_to_mark.append((row, col))
-
-        # Mark all positions at once
-        for row, col in positions_to_mark:
-            grid[row][col] = "x"
+        counts.fill(0)
+        for dr, dc in DIRECTIONS:
+            counts += rolls[1 + dr : rows + 1 + dr, 1 + dc : stride - 1 + dc]
+
+        removable = inner & (counts < 4)
+        removed = int(np.count_nonzero(removable))
+        total_count += removed
+        if not iterate_until_stable or removed == 0:
+            return total_count
+        inner &= ~removable
+
 
-        iteration_count = len(positions_to_mark)
-        total_count += iteration_count
+PARSE_VERSION = 1
 
-        # If not iterating until stable, or no new positions were marked, we're done
-        if not iterate_until_stable or iteration_count == 0:
-            break
 
-    return total_count
+def parse_input(lines: Iterable[str | bytes | memoryview]) -> PackedGrid:
+    """Pack the input rows into a grid (PackedGrid.from_lines with default padding)."""
+    return PackedGrid.from_lines(lines)
 
 
 def main():
-    from data import get_input
+    from data import parse_cached
 
-    input_str = "\n".join(get_input("data/2025/4.txt"))
-    result = solve(input_str)
-    result_loop = solve(input_str, iterate_until_stable=True)
+    grid = parse_cached("data/2025/4.txt", parse_input, PARSE_VERSION)
+    result = solve(grid.copy())
+    result_loop = solve(grid, iterate_until_stable=True)
     print(result)
     print(result_loop)
 
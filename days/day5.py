@@ -1,3 +1,8 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+
 from days.day2 import parse_range
 
 
@@ -18,23 +23,6 @@ def split_by_double_newline(s: str) -> list[str]:
     return parts
 
 
-def solve(input: str) -> int:
-    total = 0
-    fresh_ids: set[tuple[int, int]] = set()
-    parts = split_by_double_newline(input)
-    for line in parts[0].split("\n"):
-        start, end = parse_range(line.strip())
-        fresh_ids.add((start, end))
-
-    for items in parts[1].split("\n"):
-        if items.strip():
-            id = int(items.strip())
-            if any(id >= start and id <= end for start, end in fresh_ids):
-                total += 1
-
-    return total
-
-
 def merge_intervals(intervals: list[tuple[int, int]]) -> list[tuple[int, int]]:
     """Merge overlapping intervals.
 
@@ -48,18 +36,18 @@ def merge_intervals(intervals: list[tuple[int, int]]) -> list[tuple[int, int]]:
         >>> merge_intervals([(1, 5), (3, 7), (10, 12)])
         [(1, 7), (10, 12)]
     """
-    if not intervals:
-        return []
-
     # Sort intervals by start value
-    sorted_intervals = sorted(intervals)
-    merged = [sorted_intervals[0]]
+    return _merge_sorted(sorted(intervals))
+
 
-    for current_start, current_end in sorted_intervals[1:]:
-        last_start, last_end = merged[-1]
+def _merge_sorted(sorted_intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge intervals that are already sorted by start value."""
+    merged: list[tuple[int, int]] = []
 
+    for current_start, current_end in sorted_intervals:
         # If current interval overlaps with the last merged interval, merge them
-        if current_start <= last_end + 1:  # +1 to handle adjacent intervals
+        if merged and current_start <= merged[-1][1] + 1:  # +1 to handle adjacent intervals
+            last_start, last_end = merged[-1]
             merged[-1] = (last_start, max(last_end, current_end))
         else:
             merged.append((current_start, current_end))
@@ -67,6 +55,44 @@ def merge_intervals(intervals: list[tuple[int, int]]) -> list[tuple[int, int]]:
     return merged
 
 
+def merge_interval_runs(runs: Iterable[list[tuple[int, int]]]) -> list[tuple[int, int]]:
+    """Combine several sorted interval lists into one merged list.
+
+    The runs (e.g. merge_intervals output for separate chunks of input) are
+    combined with a heap-based k-way merge and coalesced in a single pass,
+    giving the same result as merge_intervals on all of the intervals at once.
+
+    Example:
+        >>> merge_interval_runs([[(1, 5), (10, 12)], [(3, 7), (13, 15)]])
+        [(1, 7), (10, 15)]
+    """
+    return _merge_sorted(heapq.merge(*runs))
+
+
+def _parse_and_merge(lines: list[str]) -> list[tuple[int, int]]:
+    return merge_intervals([parse_range(line.strip()) for line in lines if line.strip()])
+
+
+def merge_intervals_parallel(lines: list[str], workers: int = 2) -> list[tuple[int, int]]:
+    """Parse and merge "start-end" lines using a pool of worker processes.
+
+    The lines are split into one chunk per worker. Each worker parses its
+    chunk and sort-merges it locally, and the merged chunks are combined with
+    merge_interval_runs.
+
+    Args:
+        lines: Range lines like ["3-5", "10-14"]; blank lines are skipped
+        workers: Number of worker processes
+
+    Returns:
+        The same merged intervals as merge_intervals(parse_intervals(...))
+    """
+    chunk_size = max(1, -(-len(lines) // workers))
+    chunks = [lines[index : index + chunk_size] for index in range(0, len(lines), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return merge_interval_runs(executor.map(_parse_and_merge, chunks))
+
+
 def count_numbers_in_intervals(intervals: list[tuple[int, int]]) -> int:
     """Count total numbers in merged intervals without storing individual numbers.
 
@@ -83,23 +109,195 @@ def count_numbers_in_intervals(intervals: list[tuple[int, int]]) -> int:
     return sum(end - start + 1 for start, end in intervals)
 
 
-def solve2(input: str) -> int:
+def parse_intervals(section: str) -> list[tuple[int, int]]:
+    """Parse a block of "start-end" lines into a list of intervals.
+
+    Example:
+        >>> parse_intervals("3-5\\n10-14\\n")
+        [(3, 5), (10, 14)]
+    """
+    intervals: list[tuple[int, int]] = []
+    for line in section.split("\n"):
+        if line.strip():
+            intervals.append(parse_range(line.strip()))
+    return intervals
+
+
+def interval_starts(merged: list[tuple[int, int]]) -> list[int]:
+    """Return the start of each merged interval, the key list for in_intervals."""
+    return [start for start, _ in merged]
+
+
+def in_intervals(merged: list[tuple[int, int]], starts: list[int], value: int) -> bool:
+    """Check whether a value is covered by a list of merged intervals.
+
+    Binary search for the last interval starting at or before the value, so a
+    lookup is O(log intervals).
+
+    Args:
+        merged: Sorted, non-overlapping intervals from merge_intervals
+        starts: interval_starts(merged)
+        value: The value to look up
+
+    Returns:
+        True if some interval contains the value
+
+    Example:
+        >>> merged = [(3, 5), (10, 20)]
+        >>> in_intervals(merged, interval_starts(merged), 12)
+        True
+        >>> in_intervals(merged, interval_starts(merged), 8)
+        False
+    """
+    index = bisect_right(starts, value) - 1
+    return index >= 0 and value <= merged[index][1]
+
+
+def count_in_intervals(merged: list[tuple[int, int]], values: Iterable[int]) -> int:
+    """Count how many values fall inside a list of merged intervals.
+
+    The values are sorted and swept against the intervals in one linear pass,
+    instead of searching the intervals once per value.
+
+    Args:
+        merged: Sorted, non-overlapping intervals from merge_intervals
+        values: The values to look up (duplicates are counted each time)
+
+    Returns:
+        The number of values covered by an interval
+
+    Example:
+        >>> count_in_intervals([(3, 5), (10, 20)], [1, 5, 8, 11, 17, 32])
+        3
+    """
+    count = 0
+    position = 0
+    for value in sorted(values):
+        while position < len(merged) and merged[position][1] < value:
+            position += 1
+        if position == len(merged):
+            break
+        if merged[position][0] <= value:
+            count += 1
+    return count
+
+
+class IntervalSet:
+    """A mutable set of integers stored as sorted, disjoint intervals.
+
+    Intervals are kept merged (overlapping and adjacent ranges are joined, as
+    in merge_intervals) in two parallel sorted lists of starts and ends, so
+    every operation finds its place by binary search. Updates only splice the
+    intervals they touch, and the number of covered integers is kept up to
+    date as ranges are added and removed.
+
+    Example:
+        >>> fresh = IntervalSet([(3, 5), (10, 14)])
+        >>> fresh.add(12, 18)
+        >>> fresh.remove(4, 4)
+        >>> list(fresh), fresh.count_covered()
+        ([(3, 3), (5, 5), (10, 18)], 11)
+    """
+
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()):
+        merged = merge_intervals(list(intervals))
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+        self._covered = count_numbers_in_intervals(merged)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self._starts, self._ends, strict=True)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __contains__(self, value: int) -> bool:
+        return self.contains(value)
+
+    def add(self, start: int, end: int) -> None:
+        """Add every integer in [start, end] to the set."""
+        _check_interval(start, end)
+        # Intervals that overlap or touch [start, end] are absorbed into it
+        first = bisect_left(self._ends, start - 1)
+        last = bisect_right(self._starts, end + 1)
+        if first < last:
+            start = min(start, self._starts[first])
+            end = max(end, self._ends[last - 1])
+            self._covered -= self._span(first, last)
+        self._starts[first:last] = [start]
+        self._ends[first:last] = [end]
+        self._covered += end - start + 1
+
+    def remove(self, start: int, end: int) -> None:
+        """Remove every integer in [start, end] from the set."""
+        _check_interval(start, end)
+        first = bisect_left(self._ends, start)
+        last = bisect_right(self._starts, end)
+        if first >= last:
+            return
+
+        # Keep whatever sticks out on either side of the removed range
+        starts: list[int] = []
+        ends: list[int] = []
+        if self._starts[first] < start:
+            starts.append(self._starts[first])
+            ends.append(start - 1)
+        if self._ends[last - 1] > end:
+            starts.append(end + 1)
+            ends.append(self._ends[last - 1])
+
+        self._covered -= self._span(first, last)
+        self._covered += sum(
+            piece_end - piece_start + 1 for piece_start, piece_end in zip(starts, ends, strict=True)
+        )
+        self._starts[first:last] = starts
+        self._ends[first:last] = ends
+
+    def contains(self, value: int) -> bool:
+        """Return True if the value is in the set."""
+        index = bisect_right(self._starts, value) - 1
+        return index >= 0 and value <= self._ends[index]
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """Return True if any integer in [start, end] is in the set."""
+        _check_interval(start, end)
+        index = bisect_left(self._ends, start)
+        return index < len(self._starts) and self._starts[index] <= end
+
+    def count_covered(self) -> int:
+        """Return how many integers are in the set."""
+        return self._covered
+
+    def _span(self, first: int, last: int) -> int:
+        return sum(self._ends[index] - self._starts[index] + 1 for index in range(first, last))
+
+
+def _check_interval(start: int, end: int) -> None:
+    if start > end:
+        raise ValueError(f"Expected start <= end, got {start}-{end}")
+
+
+def solve(input: str) -> int:
+    parts = split_by_double_newline(input)
+    merged = merge_intervals(parse_intervals(parts[0]))
+    ids = [int(item) for item in parts[1].split("\n") if item.strip()]
+    return count_in_intervals(merged, ids)
+
+
+def solve2(input: str, workers: int = 1) -> int:
     """Solve part 2 by merging intervals and counting total numbers.
 
     Memory-efficient approach: merges overlapping intervals and calculates
-    total count without storing individual numbers.
+    total count without storing individual numbers. With ``workers`` above 1
+    the ranges are parsed and merged in parallel (see merge_intervals_parallel).
     """
     parts = split_by_double_newline(input)
-    intervals: list[tuple[int, int]] = []
-
-    # Collect all intervals
-    for line in parts[0].split("\n"):
-        if line.strip():
-            start, end = parse_range(line.strip())
-            intervals.append((start, end))
 
-    # Merge overlapping intervals
-    merged = merge_intervals(intervals)
+    # Collect and merge overlapping intervals
+    if workers > 1:
+        merged = merge_intervals_parallel(parts[0].split("\n"), workers)
+    else:
+        merged = merge_intervals(parse_intervals(parts[0]))
 
     # Count total numbers in merged intervals
     total_count = count_numbers_in_intervals(merged)
@@ -107,12 +305,108 @@ def solve2(input: str) -> int:
     return total_count
 
 
-def main():
-    from data import get_input_string
+def read_merged_intervals(
+    lines: Iterator[str | bytes], batch_size: int = 1024
+) -> list[tuple[int, int]]:
+    """Read "start-end" lines up to the first blank line and merge them as they come.
+
+    Ranges are merged into the running result in batches, so memory stays
+    proportional to the merged interval set rather than the number of lines.
+    The iterator is left positioned just after the blank line.
+
+    Args:
+        lines: An iterator over input lines, such as an open file
+        batch_size: Minimum number of new ranges to collect before each merge
+
+    Returns:
+        The merged intervals
+
+    Example:
+        >>> lines = iter(["3-5", "4-8", "", "6"])
+        >>> read_merged_intervals(lines), list(lines)
+        ([(3, 8)], ['6'])
+    """
+    merged: list[tuple[int, int]] = []
+    batch: list[tuple[int, int]] = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            break
+        batch.append(parse_range(line))
+        # Grow the batch with the merged set so total re-merging work stays O(n log n)
+        if len(batch) >= max(batch_size, len(merged)):
+            merged = merge_intervals(merged + batch)
+            batch = []
+    return merge_intervals(merged + batch)
+
+
+def solve_stream(lines: Iterable[str | bytes]) -> tuple[int, int]:
+    """Solve both parts while reading the input line by line.
+
+    Only the merged intervals are kept in memory; each ID is looked up by
+    binary search as it is read, so the ID section never has to be held or
+    sorted.
+
+    Args:
+        lines: Input lines as str or bytes, such as an open file
+
+    Returns:
+        A tuple of (fresh IDs, total numbers covered by the ranges)
+
+    Example:
+        >>> solve_stream(["3-5", "10-14", "16-20", "12-18", "", "1", "5", "8", "11", "17"])
+        (3, 14)
+    """
+    lines = iter(lines)
+    merged = read_merged_intervals(lines)
+    return count_fresh(merged, lines), count_numbers_in_intervals(merged)
+
+
+def count_fresh(merged: list[tuple[int, int]], lines: Iterable[str | bytes]) -> int:
+    """Count the ID lines that fall inside the merged intervals, as they are read.
+
+    Blank lines are skipped. Each ID is looked up by binary search, so the IDs
+    are never collected or sorted.
+
+    Example:
+        >>> count_fresh([(3, 5), (10, 20)], ["1", "5", "", "8", "11"])
+        2
+    """
+    starts = interval_starts(merged)
+    fresh = 0
+    for line in lines:
+        line = line.strip()
+        if line and in_intervals(merged, starts, int(line)):
+            fresh += 1
+    return fresh
+
+
+PARSE_VERSION = 2
+
+
+def parse_input(lines: Iterable[str | bytes | memoryview]) -> list[tuple[int, int]]:
+    """Parse the ranges section of the input into merged intervals.
 
-    input = get_input_string("data/2025/5.txt")
-    print(solve(input))
-    print(solve2(input))
+    Reading stops at the blank line, so the ID section is never touched.
+
+    Example:
+        >>> parse_input([b"3-5", b"4-8", b"", b"6", b"9"])
+        [(3, 8)]
+    """
+    return read_merged_intervals(line if isinstance(line, str) else bytes(line) for line in lines)
+
+
+def main():
+    from data import open_input, parse_cached
+
+    merged = parse_cached("data/2025/5.txt", parse_input, PARSE_VERSION)
+    with open_input("data/2025/5.txt") as puzzle:
+        sections = puzzle.sections()
+        next(sections, None)  # The ranges, already merged
+        fresh = count_fresh(merged, (bytes(line) for section in sections for line in section))
+    covered = count_numbers_in_intervals(merged)
+    print(fresh)
+    print(covered)
 
 
 if __name__ == "__main__":
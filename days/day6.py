@@ -1,4 +1,6 @@
+import math
 import re
+from collections.abc import Iterable, Iterator
 
 
 def string_to_grid_by_row_and_spaces(
@@ -65,12 +67,100 @@ def get_column_values(data_rows: list[list[str]], col_idx: int) -> list[int]:
     return column_values
 
 
-def apply_operation(operation: str, values: list[int]) -> int | None:
+# Below this many factors math.prod is faster than building a product tree
+PRODUCT_TREE_THRESHOLD = 64
+
+
+class ProductTree:
+    """Running product that multiplies its factors in a balanced binary tree.
+
+    Multiplying factors one by one makes every step multiply a huge partial
+    product by a small factor, which is quadratic in the size of the result.
+    Here partial products are only multiplied by partial products of the same
+    number of factors (like a binary counter), so big-int operands stay
+    balanced. Factors are first buffered into leaves of
+    ``PRODUCT_TREE_THRESHOLD`` and each full leaf is folded with math.prod, so a
+    short product never touches the tree and at most one leaf plus O(log n)
+    partial products are held at a time.
+
+    With ``mod`` set, every factor and partial product is reduced modulo ``mod``.
+
+    Example:
+        >>> product = ProductTree()
+        >>> product.extend([2, 3, 4])
+        >>> product.result(), len(product)
+        (24, 3)
+    """
+
+    __slots__ = ("mod", "_count", "_leaf", "_partials")
+
+    def __init__(self, mod: int | None = None):
+        self.mod = mod
+        self._count = 0
+        # Factors not yet folded into a leaf
+        self._leaf: list[int] = []
+        # (level, partial product of 2**level leaves), levels strictly decreasing
+        self._partials: list[tuple[int, int]] = []
+
+    def __len__(self) -> int:
+        return self._count + len(self._leaf)
+
+    def add(self, value: int) -> None:
+        """Multiply one more factor into the product."""
+        leaf = self._leaf
+        leaf.append(value if self.mod is None else value % self.mod)
+        if len(leaf) == PRODUCT_TREE_THRESHOLD:
+            self._push(self._fold_leaf())
+
+    def _fold_leaf(self) -> int:
+        """Multiply out the buffered leaf and empty it."""
+        value = math.prod(self._leaf)
+        self._count += len(self._leaf)
+        self._leaf.clear()
+        return value if self.mod is None else value % self.mod
+
+    def _push(self, value: int) -> None:
+        """Push a full leaf's product into the tree, merging equal-sized partials."""
+        level = 0
+        while self._partials and self._partials[-1][0] == level:
+            value *= self._partials.pop()[1]
+            if self.mod is not None:
+                value %= self.mod
+            level += 1
+        self._partials.append((level, value))
+
+    def extend(self, values: Iterable[int]) -> None:
+        """Multiply several factors into the product."""
+        for value in values:
+            self.add(value)
+
+    def result(self) -> int:
+        """Return the product of all factors so far (1 if there are none)."""
+        result = math.prod(self._leaf)
+        if not self._partials:
+            return result if self.mod is None else result % self.mod
+        if self.mod is not None:
+            result %= self.mod
+        # Smallest partial products first, so operands grow together
+        for _, partial in reversed(self._partials):
+            result *= partial
+            if self.mod is not None:
+                result %= self.mod
+        return result
+
+
+def apply_operation(operation: str, values: list[int], mod: int | None = None) -> int | None:
     """Apply an operation to a list of values.
 
+    Sums use the builtin sum. Products use math.prod for short lists and a
+    balanced ProductTree for long ones, which keeps big-int multiplication
+    from growing quadratically.
+
     Args:
         operation: Operation to apply ("+" for sum, "*" for product)
         values: List of integer values to operate on
+        mod: If set, return the result modulo this number and reduce
+            intermediate products as they are computed
 
     Returns:
         Result of the operation, or None if operation is unknown
@@ -80,6 +170,8 @@ def apply_operation(operation: str, values: list[int]) -> int | None:
         6
         >>> apply_operation("*", [2, 3, 4])
         24
+        >>> apply_operation("*", [2, 3, 4], mod=7)
+        3
         >>> apply_operation("?", [1, 2, 3]) is None
         True
     """
@@ -87,111 +179,163 @@ def apply_operation(operation: str, values: list[int]) -> int | None:
         return None
 
     if operation == "+":
-        return sum(values)
+        result = sum(values)
+        return result if mod is None else result % mod
     elif operation == "*":
-        result = 1
-        for val in values:
-            result *= val
-        return result
+        if mod is None and len(values) < PRODUCT_TREE_THRESHOLD:
+            return math.prod(values)
+        product = ProductTree(mod)
+        product.extend(values)
+        return product.result()
     else:
         return None
 
 
-def solve(input_lines: str) -> int:
+def split_operations_row(s: str) -> tuple[str, list[str]]:
+    """Split a worksheet into its data text and its operations row.
+
+    The operations row is the last non-empty line, found by searching back
+    from the end of the text rather than splitting every line first.
+
+    Args:
+        s: Worksheet text with the operations on the last line
+
+    Returns:
+        A tuple of (text before the operations row, list of operations)
+
+    Example:
+        >>> split_operations_row("1 2\\n3 4\\n*  +\\n")
+        ('1 2\\n3 4', ['*', '+'])
+    """
+    s = s.rstrip()
+    line_start = max(s.rfind("\n"), s.rfind("\r")) + 1
+    return s[: max(line_start - 1, 0)], s[line_start:].split()
+
+
+def solve(input_lines: str, mod: int | None = None) -> int:
     """Solve the puzzle.
 
     The last row contains operations (+ or *) that should be applied to each
     column. For each column, apply the operation from the last row to all
     values in that column from the other rows.
 
+    The operations row is read first, then the data rows are scanned once,
+    folding each value straight into its column's running sum or ProductTree
+    (which multiplies short columns with a single math.prod).
+
     Args:
         input_lines: Input string with rows of numbers and a last row of operations
+        mod: If set, return the answer modulo this number
 
     Returns:
         The sum of results from applying operations to each column
     """
-    grid = string_to_grid_by_row_and_spaces(input_lines, strip=False)
-
-    if not grid or len(grid) < 2:
+    data, operations = split_operations_row(input_lines)
+    if not data.strip():
         return 0
 
-    # Last row contains the operations
-    operations_row = grid[-1]
-    # Other rows contain the data
-    data_rows = grid[:-1]
-
-    total = 0
-
-    # For each column, apply the operation to all values in that column
-    for col_idx in range(len(operations_row)):
-        operation = operations_row[col_idx]
-        column_values = get_column_values(data_rows, col_idx)
+    columns = len(operations)
+    sums: list[int | None] = [None] * columns
+    products = [ProductTree(mod) if operation == "*" else None for operation in operations]
+
+    for line in data.splitlines():
+        for col_idx, token in enumerate(line.split()[:columns]):
+            if token.isdecimal():
+                value = int(token)
+            else:
+                # Rare non-digit tokens: accept what int() accepts, skip the rest
+                try:
+                    value = int(token)
+                except ValueError:
+                    continue
+
+            operation = operations[col_idx]
+            if operation == "+":
+                running = sums[col_idx]
+                sums[col_idx] = value if running is None else running + value
+            elif operation == "*":
+                products[col_idx].add(value)
+
+    total = sum(result for result in sums if result is not None)
+    total += sum(product.result() for product in products if product)
+    return total if mod is None else total % mod
+
+
+def iter_problem_groups(input_lines: str) -> Iterator[tuple[list[int], str]]:
+    """Yield the (numbers, operation) groups of a part 2 worksheet.
+
+    Numbers are written vertically, one digit per row, and read column by
+    column from right to left. A space ends the current number; an operation
+    closes the group of numbers collected since the previous operation.
+
+    The rows are copied once into a fixed-width byte buffer, one row per
+    stride, as wide as the first row plus one column. Each row is ended by a
+    space, and a NUL byte marks cells past the end of a shorter row, which are
+    skipped. The scan then only reads single bytes in column order.
 
-        if not column_values:
-            continue
+    Args:
+        input_lines: Worksheet text with the operations on the last line
 
-        result = apply_operation(operation, column_values)
-        if result is not None:
-            total += result
+    Returns:
+        An iterator over (numbers, operation) tuples, rightmost group first
 
-    return total
+    Example:
+        >>> list(iter_problem_groups("12 3\\n45 6\\n*  +"))
+        [([36], '+'), ([25, 14], '*')]
+    """
+    normalized = input_lines.replace("\r\n", "\n").replace("\r", "\n")
+    lines = [line for line in normalized.split("\n") if line.strip()]
+    if not lines:
+        return
+
+    width = len(lines[0]) + 1
+    buffer = bytearray(len(lines) * width)
+    for row, line in enumerate(lines):
+        start = row * width
+        cells = line[:width].encode("ascii", "replace")
+        buffer[start : start + len(cells)] = cells
+        if len(line) < width:
+            buffer[start + len(line)] = ord(" ")
+
+    number = 0
+    has_digits = False
+    collected: list[int] = []
+    for col in range(width - 1, -1, -1):
+        # Walk rows from top to bottom for this column
+        for cell in buffer[col::width]:
+            if 48 <= cell <= 57:
+                number = number * 10 + cell - 48
+                has_digits = True
+            elif cell == 32 or cell == 43 or cell == 42:
+                # Space or operation - finish current number if we have one
+                if has_digits:
+                    collected.append(number)
+                    number = 0
+                    has_digits = False
+                if cell != 32:
+                    if collected:
+                        yield collected, chr(cell)
+                        collected = []
+                    # Continue to next column (operation processed)
+                    break
+
+
+def solve_part_2(input_lines: str, mod: int | None = None) -> int:
+    """Solve the puzzle for part 2.
 
+    Args:
+        input_lines: Worksheet text with the operations on the last line
+        mod: If set, return the answer modulo this number
 
-def solve_part_2(input_lines: str) -> int:
-    """Solve the puzzle for part 2."""
-    grid = string_to_grid_by_row_and_spaces(input_lines, split_by=re.compile(r""))
-    columns = len(grid[0])
-    array = []
+    Returns:
+        The sum of results from applying each operation to its group of numbers
+    """
     total = 0
-
-    # Process columns from right to left (top right to bottom left)
-    # Accumulate numbers across columns until we hit an operation
-    collected_numbers = []  # Collect all integers across columns
-    current_number_str = ""  # Build number string from consecutive digits
-
-    for col in range(columns - 1, -1, -1):
-        # Walk rows from top to bottom for this column
-        for _, row in enumerate(grid):
-            if col >= len(row):
-                # Skip if column doesn't exist in this row (jagged array)
-                continue
-
-            cell = row[col]
-
-            if cell.isdigit():
-                # Add digit to current number string
-                current_number_str += cell
-            elif cell == " " or cell == "":
-                # Space or empty - finish current number if we have one
-                if current_number_str:
-                    collected_numbers.append(int(current_number_str))
-                    current_number_str = ""
-                # Continue to next row
-            elif cell == "+" or cell == "*":
-                # Found operation - finish current number if we have one
-                if current_number_str:
-                    collected_numbers.append(int(current_number_str))
-                    current_number_str = ""
-
-                # Group all collected numbers with this operation
-                if collected_numbers:
-                    operation = cell
-                    array.append((collected_numbers.copy(), operation))
-                    collected_numbers = []  # Reset for next operation
-                # Continue to next column (operation processed)
-                break
-
-    # Process the array: each tuple contains (list_of_integers, operation)
-    while array:
-        item = array.pop(0)
-        if isinstance(item, tuple):
-            numbers, operation = item
-            print(numbers, operation)
-            result = apply_operation(operation, numbers)
-            if result is not None:
-                total += result
-    print(array)
-    return total
+    for numbers, operation in iter_problem_groups(input_lines):
+        result = apply_operation(operation, numbers, mod)
+        if result is not None:
+            total += result
+    return total if mod is None else total % mod
 
 
 def main():
@@ -0,0 +1,17 @@
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from tests.stand_in import StandIn
+
+
+@pytest.fixture
+def server():
+    StandIn.requests_seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
@@ -0,0 +1,35 @@
+"""A local stand-in for the puzzle site, shared by the download tests."""
+
+from http.server import BaseHTTPRequestHandler
+
+INPUTS = {("2025", str(day)): f"input {day}\n".encode() for day in range(1, 6)}
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Serves INPUTS at /{year}/day/{day}/input like the puzzle site."""
+
+    requests_seen: list[tuple[str, dict]] = []
+
+    def do_GET(self):
+        self.requests_seen.append((self.path, dict(self.headers)))
+        parts = self.path.strip("/").split("/")
+        if "session=token" not in self.headers.get("Cookie", ""):
+            self.send_response(400)
+            self.end_headers()
+            return
+        if len(parts) != 4 or (parts[0], parts[2]) not in INPUTS:
+            self.send_response(404)
+            self.end_headers()
+            return
+        if "If-Modified-Since" in self.headers:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = INPUTS[parts[0], parts[2]]
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
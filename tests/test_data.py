@@ -0,0 +1,182 @@
+import asyncio
+import os
+import time
+
+from data import MappedInput, RateLimiter, bootstrap, open_input, parse_cached, parse_days
+from data_file import make_session
+from days import day2, day4, day5
+from days.day1 import solve as solve_day1
+from days.day4 import PackedGrid
+from days.day4 import solve as solve_day4
+from days.day5 import solve_stream
+from tests.stand_in import StandIn
+
+
+def write_input(tmp_path, content: bytes) -> str:
+    path = tmp_path / "input.txt"
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_lines_are_stripped_views(tmp_path):
+    with MappedInput(write_input(tmp_path, b"abc\r\n  de \n\nf")) as puzzle:
+        lines = [bytes(line) for line in puzzle.lines()]
+    assert lines == [b"abc", b"de", b"", b"f"]
+
+
+def test_lines_match_get_input_without_trailing_newline(tmp_path):
+    with MappedInput(write_input(tmp_path, b"1\n2\n")) as puzzle:
+        assert [bytes(line) for line in puzzle.lines()] == [b"1", b"2"]
+
+
+def test_sections_split_on_blank_lines(tmp_path):
+    with MappedInput(write_input(tmp_path, b"\n1-2\n3-4\n\n\n5\n6\n")) as puzzle:
+        sections = [[bytes(line) for line in section] for section in puzzle.sections()]
+    assert sections == [[b"1-2", b"3-4"], [b"5", b"6"]]
+
+
+def test_view_covers_whole_file(tmp_path):
+    with MappedInput(write_input(tmp_path, b"xyz\n")) as puzzle:
+        view = puzzle.view()
+        assert view.tobytes() == b"xyz\n"
+        view.release()
+
+
+def test_empty_file(tmp_path):
+    with MappedInput(write_input(tmp_path, b"")) as puzzle:
+        assert list(puzzle.lines()) == []
+        assert list(puzzle.sections()) == []
+        assert len(puzzle.view()) == 0
+
+
+def test_open_input_is_relative_to_repo(tmp_path):
+    with open_input(write_input(tmp_path, b"L68\n")) as puzzle:
+        assert bytes(next(puzzle.lines())) == b"L68"
+
+
+def test_solvers_consume_mapped_lines(tmp_path):
+    rotations = b"L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82\n"
+    with MappedInput(write_input(tmp_path, rotations)) as puzzle:
+        assert solve_day1(bytes(line) for line in puzzle.lines()) == 3
+
+    fresh = b"3-5\n10-14\n16-20\n12-18\n\n1\n5\n8\n11\n17\n32\n"
+    with MappedInput(write_input(tmp_path, fresh)) as puzzle:
+        assert solve_stream(bytes(line) for line in puzzle.lines()) == (3, 14)
+
+    rolls = b"@@.\n@@@\n.@.\n"
+    with MappedInput(write_input(tmp_path, rolls)) as puzzle:
+        grid = PackedGrid.from_lines(puzzle.lines())
+    assert solve_day4(grid.copy()) == solve_day4("@@.\n@@@\n.@.")
+    assert solve_day4(grid, iterate_until_stable=True) == solve_day4(
+        "@@.\n@@@\n.@.", iterate_until_stable=True
+    )
+
+
+def counting_parser(calls):
+    def parse(lines):
+        calls.append(1)
+        return [bytes(line) for line in lines]
+
+    return parse
+
+
+def test_parse_cached_skips_parser_on_warm_run(tmp_path):
+    path = write_input(tmp_path, b"a\nb\n")
+    cache_dir = str(tmp_path / "cache")
+    calls = []
+    parser = counting_parser(calls)
+
+    assert parse_cached(path, parser, cache_dir=cache_dir) == [b"a", b"b"]
+    assert parse_cached(path, parser, cache_dir=cache_dir) == [b"a", b"b"]
+    assert len(calls) == 1
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_parse_cached_invalidates_on_content_or_version_change(tmp_path):
+    path = write_input(tmp_path, b"a\n")
+    cache_dir = str(tmp_path / "cache")
+    calls = []
+    parser = counting_parser(calls)
+
+    parse_cached(path, parser, cache_dir=cache_dir)
+    parse_cached(path, parser, version=2, cache_dir=cache_dir)
+    assert len(calls) == 2
+
+    write_input(tmp_path, b"b\n")
+    assert parse_cached(path, parser, version=2, cache_dir=cache_dir) == [b"b"]
+    assert len(calls) == 3
+
+
+def test_parse_cached_reparses_corrupt_cache(tmp_path):
+    path = write_input(tmp_path, b"a\n")
+    cache_dir = tmp_path / "cache"
+    calls = []
+    parser = counting_parser(calls)
+
+    parse_cached(path, parser, cache_dir=str(cache_dir))
+    for cache_file in cache_dir.iterdir():
+        cache_file.write_bytes(b"not a pickle")
+    assert parse_cached(path, parser, cache_dir=str(cache_dir)) == [b"a"]
+    assert len(calls) == 2
+
+
+def test_cached_day_parsers_round_trip(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+
+    path = write_input(tmp_path, b"11-22,95-115,998-1012\n")
+    for _ in range(2):
+        ranges = parse_cached(path, day2.parse_input, day2.PARSE_VERSION, cache_dir)
+        assert day2.solve_ranges(ranges) == 11 + 22 + 99 + 1010
+
+    path = write_input(tmp_path, b"@@.\n@@@\n.@.\n")
+    expected = PackedGrid.from_lines([b"@@.", b"@@@", b".@."])
+    for _ in range(2):
+        grid = parse_cached(path, day4.parse_input, day4.PARSE_VERSION, cache_dir)
+        assert grid.to_lists() == expected.to_lists()
+        assert solve_day4(grid) == solve_day4(expected.copy())
+
+    path = write_input(tmp_path, b"3-5\n10-14\n16-20\n12-18\n\n1\n5\n8\n11\n17\n32\n")
+    for _ in range(2):
+        merged = parse_cached(path, day5.parse_input, day5.PARSE_VERSION, cache_dir)
+        assert merged == [(3, 5), (10, 20)]
+
+
+def test_parse_days():
+    assert parse_days("1-25") == list(range(1, 26))
+    assert parse_days("3, 1-2,2") == [1, 2, 3]
+
+
+def test_rate_limiter_spaces_calls():
+    async def acquire_all(limiter, n):
+        for _ in range(n):
+            await limiter.acquire()
+
+    start = time.monotonic()
+    asyncio.run(acquire_all(RateLimiter(50), 6))
+    assert time.monotonic() - start >= 5 / 50
+
+
+def test_bootstrap_is_resumable(server, tmp_path):
+    root = tmp_path / "repo"
+    (root / "days").mkdir(parents=True)
+    (root / "tests").mkdir()
+    (root / "days" / "day2.py").write_text("# already solved\n")
+    data_dir = str(tmp_path / "data")
+
+    with make_session("token") as session:
+        results = asyncio.run(
+            bootstrap("2025", [1, 2, 9], 100, 3, session, server, data_dir, str(root))
+        )
+        assert results[1][0] == "downloaded"
+        assert results[2][0] == "downloaded"
+        assert results[9][0].startswith("failed")
+        assert (root / "days" / "day2.py").read_text() == "# already solved\n"
+        assert sorted(os.listdir(root / "tests")) == ["test_day1.py", "test_day2.py"]
+
+        # A second run only retries the day that failed
+        StandIn.requests_seen.clear()
+        results = asyncio.run(
+            bootstrap("2025", [1, 2, 9], 100, 3, session, server, data_dir, str(root))
+        )
+    assert [status for status, _ in results.values()][:2] == ["cached", "cached"]
+    assert [path for path, _ in StandIn.requests_seen] == ["/2025/day/9/input"]
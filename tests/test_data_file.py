@@ -0,0 +1,57 @@
+import os
+
+import pytest
+import requests
+
+from data_file import DataFile, fetch_inputs, make_session
+from tests.stand_in import INPUTS, StandIn
+
+
+def test_fetch_inputs_downloads_each_missing_file_once(server, tmp_path):
+    puzzles = list(INPUTS)
+    with make_session("token", pool_size=4) as session:
+        files = fetch_inputs(puzzles, 4, session, base_url=server, data_dir=str(tmp_path))
+        assert [data_file.downloaded for data_file in files] == [True] * len(puzzles)
+        for (year, day), data_file in zip(puzzles, files, strict=True):
+            with open(data_file.path, "rb") as f:
+                assert f.read() == INPUTS[year, day]
+        assert len(StandIn.requests_seen) == len(puzzles)
+
+        # Everything is on disk now, so a second run sends nothing
+        files = fetch_inputs(puzzles, 4, session, base_url=server, data_dir=str(tmp_path))
+        assert not any(data_file.downloaded for data_file in files)
+        assert len(StandIn.requests_seen) == len(puzzles)
+
+    assert sorted(os.listdir(tmp_path / "2025")) == sorted(f"{day}.txt" for _, day in puzzles)
+
+
+def test_existing_files_need_no_token(tmp_path, monkeypatch):
+    monkeypatch.delenv("AOC_SESSION", raising=False)
+    (tmp_path / "2025").mkdir()
+    (tmp_path / "2025" / "1.txt").write_text("cached\n")
+    files = fetch_inputs([("2025", "1")], base_url="http://unused.invalid", data_dir=str(tmp_path))
+    assert not files[0].downloaded
+
+
+def test_refresh_sends_conditional_request(server, tmp_path):
+    (tmp_path / "2025").mkdir()
+    (tmp_path / "2025" / "1.txt").write_text("cached\n")
+    with make_session("token") as session:
+        data_file = DataFile("2025", "1", session, True, server, str(tmp_path))
+    assert not data_file.downloaded
+    assert "If-Modified-Since" in StandIn.requests_seen[0][1]
+    assert (tmp_path / "2025" / "1.txt").read_text() == "cached\n"
+
+
+def test_error_status_raises_and_writes_nothing(server, tmp_path):
+    with make_session("token") as session:
+        with pytest.raises(requests.HTTPError):
+            fetch_inputs([("2025", "1"), ("2025", "25")], 2, session, False, server, str(tmp_path))
+    # The good download still landed; the failed one left no file or temporary behind
+    assert os.listdir(tmp_path / "2025") == ["1.txt"]
+
+
+def test_bad_session_token_raises(server, tmp_path):
+    with make_session("wrong") as session:
+        with pytest.raises(requests.HTTPError):
+            DataFile("2025", "1", session, base_url=server, data_dir=str(tmp_path))
@@ -1,4 +1,6 @@
-from days.day1 import move, parse_line, solve
+import random
+
+from days.day1 import move, parse_line, parse_steps, solve, solve_batch
 
 input = """L68
 L30
@@ -27,3 +29,59 @@ def test_parse_line():
     assert parse_line("L1") == (-1, 1)
     assert parse_line("R10") == (1, 10)
     assert parse_line("L10") == (-1, 10)
+
+
+def _move_by_clicks(line: str, position: int) -> tuple[int, int]:
+    direction, steps = parse_line(line)
+    zeroes = 0
+    for _ in range(steps):
+        position = (position + direction) % 100
+        if position == 0:
+            zeroes += 1
+    return position, zeroes
+
+
+def test_move_matches_click_by_click():
+    rng = random.Random(2025)
+    for _ in range(2000):
+        line = f"{rng.choice('LR')}{rng.randint(0, 450)}"
+        position = rng.randint(0, 99)
+        assert move(line, position) == _move_by_clicks(line, position)
+
+
+def test_move_large_steps():
+    assert move("R1000000000", 50) == (50, 10000000)
+    assert move("L1000000000", 0) == (0, 10000000)
+    assert move("L1000000050", 50) == (0, 10000001)
+
+
+def test_parse_steps():
+    assert list(parse_steps(["R10", "L5", "R0", ""])) == [10, -5, 0]
+
+
+def test_solve_batch():
+    assert solve_batch(input.split("\n")) == (3, 6)
+    assert solve_batch([]) == (0, 0)
+
+
+def test_solve_batch_matches_move():
+    rng = random.Random(1)
+    lines = [f"{rng.choice('LR')}{rng.randint(0, 1000)}" for _ in range(5000)]
+    position, zeroes, all_zeroes = 50, 0, 0
+    for line in lines:
+        position, count = move(line, position)
+        all_zeroes += count
+        zeroes += position == 0
+    assert solve_batch(lines) == (zeroes, all_zeroes)
+
+
+def test_steps_beyond_64_bits():
+    huge = 2**63 + 50
+    lines = ["R10", f"R{huge}", "L7"]
+    assert parse_steps(lines) == [10, huge, -7]
+    position, all_zeroes = 50, 0
+    for line in lines:
+        position, count = move(line, position)
+        all_zeroes += count
+    assert solve(lines, count_all=True) == all_zeroes
+    assert solve_batch(["R100000000000000000000"]) == (0, 10**18)
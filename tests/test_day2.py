@@ -1,13 +1,24 @@
+import random
+import tracemalloc
+
 import pytest
 
 from days.day2 import (
     has_repeated_pattern,
+    id_range,
     invalid_ids,
+    is_repeated_id,
     is_valid_id,
+    iter_invalid_ids,
+    parse_input,
     parse_range,
+    plan_chunks,
     process_range,
     range_list,
+    scan_invalid_ids,
     solve,
+    split_ranges,
+    sum_invalid_ids,
 )
 
 
@@ -189,3 +200,126 @@ def test_solve_check_repeating_individual_ranges():
     # 2121212118-2121212124 now has one invalid ID, 2121212121
     assert invalid_ids(process_range("2121212118-2121212124"), check_repeating=True) == [2121212121]
     assert solve(["2121212118-2121212124"], check_repeating=True) == 2121212121
+
+
+def test_iter_invalid_ids():
+    assert list(iter_invalid_ids(11, 22)) == [11, 22]
+    assert list(iter_invalid_ids(95, 115)) == [99]
+    assert list(iter_invalid_ids(95, 115, check_repeating=True)) == [99, 111]
+    assert list(iter_invalid_ids(115, 95, check_repeating=True)) == [99, 111]
+    # 111111 repeats at periods 1, 2 and 3 but is only reported once
+    assert list(iter_invalid_ids(111110, 111112, check_repeating=True)) == [111111]
+
+
+def test_iter_invalid_ids_matches_brute_force():
+    rng = random.Random(2025)
+    for _ in range(300):
+        start = rng.randint(0, 10 ** rng.randint(1, 5))
+        end = start + rng.randint(0, 5000)
+        for check_repeating in (False, True):
+            expected = invalid_ids(range(start, end + 1), check_repeating)
+            assert list(iter_invalid_ids(start, end, check_repeating)) == expected
+            assert sum_invalid_ids(start, end, check_repeating) == sum(expected)
+
+
+def test_sum_invalid_ids_huge_range():
+    # Every even-length ID below 10^12 whose halves match: block * (10^k + 1)
+    expected = sum(
+        (10**k + 1) * (10 ** (k - 1) + 10**k - 1) * (10**k - 10 ** (k - 1)) // 2
+        for k in range(1, 7)
+    )
+    assert sum_invalid_ids(1, 10**12) == expected
+    assert sum_invalid_ids(10**12, 1) == expected
+
+
+def test_split_ranges():
+    assert list(split_ranges("11-22,95-115")) == ["11-22", "95-115"]
+    assert list(split_ranges(" 1-5 , 7-9,")) == ["1-5", "7-9", ""]
+    assert list(split_ranges("1-5")) == ["1-5"]
+
+
+def test_id_range():
+    assert list(id_range(1, 5)) == [1, 2, 3, 4, 5]
+    assert list(id_range(5, 1)) == [5, 4, 3, 2, 1]
+    assert list(id_range(3, 3)) == [3]
+
+
+def test_scan_invalid_ids():
+    assert list(scan_invalid_ids(id_range(95, 115))) == [99]
+    assert list(scan_invalid_ids(id_range(95, 115), check_repeating=True)) == [99, 111]
+
+
+def test_solve_split_ranges():
+    line = "11-22,95-115,998-1012,1188511880-1188511890,222220-222224"
+    assert solve(split_ranges(line)) == 11 + 22 + 99 + 1010 + 1188511885 + 222222
+
+
+def _peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_solve_memory_is_bounded():
+    """Peak memory must not grow with the width or number of ranges."""
+
+    def synthetic_ranges(count: int):
+        # Each range spans a billion IDs
+        return (f"{i * 10**9 + 1}-{(i + 1) * 10**9}" for i in range(count))
+
+    small = _peak_memory(lambda: solve(synthetic_ranges(10), check_repeating=True))
+    large = _peak_memory(lambda: solve(synthetic_ranges(10_000), check_repeating=True))
+    assert large < 64 * 1024
+    assert large < small * 2 + 4096
+
+
+def test_scan_memory_is_bounded():
+    peak = _peak_memory(lambda: sum(scan_invalid_ids(id_range(1, 200_000), True)))
+    # A materialised list of 200k ints alone would be well over a megabyte
+    assert peak < 64 * 1024
+
+
+def test_plan_chunks_splits_wide_ranges():
+    chunks = plan_chunks([(1, 100), (101, 110)], 2)
+    assert chunks == [[(1, 55)], [(56, 100), (101, 110)]]
+    pieces = sorted(piece for chunk in plan_chunks([(1000, 1), (5, 5)], 4) for piece in chunk)
+    assert pieces == [(1, 251), (5, 5), (252, 502), (503, 753), (754, 1000)]
+    assert plan_chunks([], 4) == []
+
+
+def test_solve_workers_matches_serial():
+    ranges = ["11-22", "95-115", "998-1012", "1-1000000000000", "2121212118-2121212124"]
+    for check_repeating in (False, True):
+        assert solve(ranges, check_repeating, workers=2) == solve(ranges, check_repeating)
+
+
+def test_is_repeated_id():
+    assert is_repeated_id(123123123) is True
+    assert is_repeated_id(1111) is True
+    assert is_repeated_id(1234) is False
+    assert is_repeated_id(7) is False
+    assert is_repeated_id(0) is False
+    assert is_repeated_id(123123123, check_repeating=False) is False
+    assert is_repeated_id(446446, check_repeating=False) is True
+
+
+def test_is_repeated_id_matches_string_checks():
+    rng = random.Random(6)
+    for digits in range(1, 21):
+        periods = [period for period in range(1, digits + 1) if digits % period == 0]
+        for _ in range(200):
+            period = rng.choice(periods)
+            block = str(rng.randint(10 ** (period - 1), 10**period - 1))
+            id_str = block * (digits // period)
+            assert is_repeated_id(int(id_str)) is has_repeated_pattern(id_str)
+            assert is_repeated_id(int(id_str), check_repeating=False) is not is_valid_id(id_str)
+
+
+def test_parse_input_skips_empty_pieces():
+    assert parse_input([b"11-22,95-115,"]) == [(11, 22), (95, 115)]
+    assert parse_input(["11-22, ,95-115\n"]) == [(11, 22), (95, 115)]
+    assert parse_input([b"", b"11-22"]) == []
+    assert parse_input([]) == []
@@ -1,4 +1,17 @@
-from days.day3 import highest_number, solve, string_to_ints
+import random
+from itertools import combinations
+
+from days.day3 import (
+    digit_positions,
+    highest_number,
+    highest_number_bytes,
+    highest_number_from_positions,
+    iter_banks,
+    solve,
+    solve_bytes,
+    solve_many,
+    string_to_ints,
+)
 
 
 def test_string_to_ints():
@@ -85,3 +98,72 @@ def test_solve_sample_input():
     ]
     assert solve(input_lines) == 357
     assert solve(input_lines, n=12) == 3121910778619
+
+
+def test_highest_number_matches_brute_force():
+    rng = random.Random(3)
+    for _ in range(500):
+        digits = [rng.randint(0, 9) for _ in range(rng.randint(0, 10))]
+        n = rng.randint(0, 6)
+        expected = max(
+            (int("".join(map(str, combo)) or 0) for combo in combinations(digits, n)),
+            default=0,
+        )
+        assert highest_number(digits, n) == expected
+
+
+def test_highest_number_long_bank():
+    digits = [int(char) for char in "123456789" * 1000]
+    assert highest_number(digits, n=100) == int("9" * 100)
+
+
+def test_highest_number_bytes():
+    assert highest_number_bytes(b"5192") == 92
+    assert highest_number_bytes(memoryview(b"1234"), n=3) == 234
+    assert highest_number_bytes(b"120") == 20
+    assert highest_number_bytes(b"5") == 0
+    assert highest_number_bytes(b"") == 0
+
+
+def test_iter_banks():
+    data = b"123\r\n\n5192\n  \n7"
+    assert [bytes(bank) for bank in iter_banks(data)] == [b"123", b"5192", b"7"]
+    assert list(iter_banks(b"")) == []
+
+
+def test_solve_bytes_matches_solve():
+    input_lines = [
+        "987654321111111",
+        "811111111111119",
+        "234234234234278",
+        "818181911112111",
+    ]
+    data = "\n".join(input_lines).encode()
+    assert solve_bytes(data) == solve(input_lines) == 357
+    assert solve_bytes(data, n=12) == solve(input_lines, n=12) == 3121910778619
+
+
+def test_highest_number_from_positions_matches_highest_number():
+    rng = random.Random(9)
+    for _ in range(300):
+        bank = "".join(rng.choice("0123456789") for _ in range(rng.randint(0, 40)))
+        positions = digit_positions(bank.encode())
+        for n in (0, 1, 2, 5, 12):
+            expected = highest_number(string_to_ints(bank), n)
+            assert highest_number_from_positions(positions, len(bank), n) == expected
+
+
+def test_solve_many():
+    input_lines = [
+        "987654321111111",
+        "811111111111119",
+        "234234234234278",
+        "818181911112111",
+    ]
+    assert solve_many(input_lines) == {2: 357, 12: 3121910778619}
+    data = "\n".join(input_lines).encode()
+    totals = solve_many(iter_banks(data), ns=[1, 2, 12])
+    assert totals == {n: solve(input_lines, n) for n in (1, 2, 12)}
+    assert solve_many(["", " "], ns=[2]) == {2: 0}
+    assert solve_many(["5192"], ns=[2, 2]) == {2: 92}
+    assert solve_many([b"5192\r\n", b" 123 ", b"\n"], ns=[2]) == {2: 115}
@@ -1,4 +1,21 @@
-from days.day4 import check_adjacent, solve, string_to_grid
+import pickle
+import random
+
+import pytest
+
+import days.day4
+from days.day4 import (
+    MOORE,
+    VON_NEUMANN,
+    PackedGrid,
+    check_adjacent,
+    count_adjacent,
+    peel_until_stable,
+    radius_kernel,
+    solve,
+    solve_numpy,
+    string_to_grid,
+)
 
 
 def test_check_adjacent_center():
@@ -315,3 +332,193 @@ def test_solve_iterate_until_stable_no_change():
     assert isinstance(result1, int)
     assert isinstance(result2, int)
     assert result2 >= result1  # Iterating might mark more positions
+
+
+def _solve_by_rounds(input_str: str) -> int:
+    """Reference: rescan the whole grid every round until nothing changes."""
+    grid = string_to_grid(input_str)
+    total = 0
+    while True:
+        marked = [
+            (row, col)
+            for row in range(len(grid))
+            for col in range(len(grid[row]))
+            if grid[row][col] == "@" and count_adjacent(grid, row, col, "@") < 4
+        ]
+        for row, col in marked:
+            grid[row][col] = "x"
+        total += len(marked)
+        if not marked:
+            return total
+
+
+def test_peel_until_stable_matches_rounds():
+    rng = random.Random(4)
+    for _ in range(200):
+        rows = [
+            "".join(rng.choice("@@@.") for _ in range(rng.randint(1, 12)))
+            for _ in range(rng.randint(1, 12))
+        ]
+        input_str = "\n".join(rows)
+        assert solve(input_str, iterate_until_stable=True) == _solve_by_rounds(input_str)
+
+
+def test_peel_until_stable_marks_removed():
+    grid = string_to_grid("@@@\n@@@\n@@@")
+    assert peel_until_stable(grid) == 9
+    assert grid == [["x"] * 3] * 3
+    grid = string_to_grid("@@@@\n@@@@\n@@@@\n@@@@")
+    assert peel_until_stable(grid) == 4  # only the corners; edges keep 4 neighbours
+    assert peel_until_stable(string_to_grid("...")) == 0
+
+
+def test_packed_grid_jagged():
+    grid = PackedGrid.from_string("ABC\r\nDE\n\nF")
+    assert len(grid) == 3
+    assert grid.to_lists() == string_to_grid("ABC\r\nDE\n\nF")
+    assert grid[0, 2] == "C"
+    assert grid.contains(1, 1) and not grid.contains(1, 2) and not grid.contains(3, 0)
+    assert grid.position(grid.index(2, 0)) == (2, 0)
+    # One byte per cell plus the padded border
+    assert len(grid.cells) == (3 + 2) * (3 + 2)
+
+
+def test_packed_grid_matches_lists():
+    rng = random.Random(11)
+    for _ in range(100):
+        input_str = "\n".join(
+            "".join(rng.choice("@@.") for _ in range(rng.randint(1, 8)))
+            for _ in range(rng.randint(1, 8))
+        )
+        grid = string_to_grid(input_str)
+        packed = PackedGrid.from_string(input_str)
+        for row in range(-1, len(grid) + 1):
+            for col in range(-1, 10):
+                assert count_adjacent(packed, row, col, "@") == count_adjacent(grid, row, col, "@")
+                expected = check_adjacent(grid, row, col, "@", 4)
+                assert check_adjacent(packed, row, col, "@", 4) is expected
+        assert packed.to_lists() == grid
+
+
+def test_check_adjacent_packed_grid():
+    grid = PackedGrid.from_string("ABC\nDEF\nGHI")
+    assert check_adjacent(grid, 1, 1, "A", 2) is True
+    assert grid[1, 1] == "x"
+    assert check_adjacent(grid, 0, 0, "B", 1) is False
+    assert check_adjacent(PackedGrid([]), 0, 0, "A", 1) is False
+
+
+def _random_grid(rng: random.Random, rows: int, cols: int) -> str:
+    return "\n".join(
+        "".join(rng.choice("@@@.") for _ in range(rng.randint(1, cols))) for _ in range(rows)
+    )
+
+
+def test_solve_numpy_matches_solve():
+    pytest.importorskip("numpy")
+    rng = random.Random(12)
+    for _ in range(100):
+        input_str = _random_grid(rng, rng.randint(1, 15), 15)
+        for iterate_until_stable in (False, True):
+            expected = solve(input_str, iterate_until_stable)
+            assert solve_numpy(input_str, iterate_until_stable) == expected
+    assert solve_numpy("") == 0
+
+
+def test_solve_numpy_falls_back_without_numpy(monkeypatch):
+    monkeypatch.setattr(days.day4, "np", None)
+    input_str = _random_grid(random.Random(1), 10, 10)
+    assert solve_numpy(input_str, True) == solve(input_str, True)
+
+
+def test_solve_workers_matches_serial():
+    rng = random.Random(13)
+    for rows in (1, 2, 7, 25):
+        input_str = _random_grid(rng, rows, 25)
+        for iterate_until_stable in (False, True):
+            expected = solve(input_str, iterate_until_stable)
+            assert solve(input_str, iterate_until_stable, workers=3) == expected
+    assert solve("", workers=2) == 0
+
+
+def test_neighbour_counts_matches_count_adjacent():
+    rng = random.Random(14)
+    kernels = [MOORE, VON_NEUMANN, radius_kernel(2), ((0, 2), (-2, -1), (1, 1))]
+    for _ in range(30):
+        input_str = _random_grid(rng, rng.randint(1, 10), 10)
+        grid = string_to_grid(input_str)
+        packed = PackedGrid.from_string(input_str, padding=2)
+        for kernel in kernels:
+            counts = packed.neighbour_counts("@", kernel)
+            for row in range(len(grid)):
+                for col in range(len(grid[row])):
+                    expected = count_adjacent(grid, row, col, "@", kernel)
+                    assert counts[packed.index(row, col)] == expected
+                    assert count_adjacent(packed, row, col, "@", kernel) == expected
+
+
+def test_neighbour_counts_cache_invalidation():
+    grid = PackedGrid.from_string("@@@\n@@@\n@@@")
+    counts = grid.neighbour_counts("@")
+    assert grid.neighbour_counts("@") is counts
+    assert counts[grid.index(1, 1)] == 8
+    grid[0, 0] = "."
+    assert grid.neighbour_counts("@")[grid.index(1, 1)] == 7
+    assert grid.neighbour_counts("@", VON_NEUMANN)[grid.index(1, 1)] == 4
+
+
+def test_neighbour_counts_kernel_wider_than_padding():
+    with pytest.raises(ValueError, match="exceeds grid padding"):
+        PackedGrid.from_string("@@").neighbour_counts("@", radius_kernel(2))
+
+
+def test_packed_grid_rejects_padding_below_neighbour_radius():
+    with pytest.raises(ValueError, match="padding 0"):
+        PackedGrid(["@@", "@@"], padding=0)
+    assert count_adjacent(PackedGrid(["@@", "@@"], padding=2), 0, 0, "@") == 3
+
+
+def test_check_adjacent_kernel():
+    grid = [["A", "A", "A"], ["A", "B", "A"], ["A", "A", "A"]]
+    assert check_adjacent(grid, 1, 1, "A", 5, kernel=VON_NEUMANN) is True
+    assert check_adjacent(grid, 0, 0, "A", 2, kernel=VON_NEUMANN) is False
+
+
+def test_packed_grid_pickles_with_cached_counts():
+    grid = PackedGrid.from_string("@@.\n@@@\n.@.")
+    counts = bytes(grid.neighbour_counts("@"))
+    copy = pickle.loads(pickle.dumps(grid, protocol=5))
+    assert copy.to_lists() == grid.to_lists()
+    assert copy._counts == {}
+    assert bytes(copy.neighbour_counts("@")) == counts
+    assert solve(copy) == solve(grid.copy())
+
+
+def test_solve_with_characters_beyond_latin1():
+    lists = string_to_grid("@€@\n@@@")
+    expected = sum(
+        1
+        for row, line in enumerate(lists)
+        for col, cell in enumerate(line)
+        if cell == "@" and count_adjacent(lists, row, col, "@") < 4
+    )
+    assert solve("@€@\n@@@") == expected == 4
+    assert solve("@€@\n@@@", iterate_until_stable=True) == 5
+    grid = PackedGrid.from_string("@€\n@@")
+    assert grid[0, 1] == "\0"
+    assert count_adjacent(grid, 1, 1, "@") == 2
+
+
+def test_solve_marks_packed_grid_the_same_for_any_worker_count():
+    rng = random.Random(13)
+    input_str = "\n".join("".join(rng.choice("@@@.") for _ in range(15)) for _ in range(12))
+    for iterate_until_stable in (False, True):
+        serial = PackedGrid.from_string(input_str)
+        parallel = PackedGrid.from_string(input_str)
+        serial.neighbour_counts("@")
+        parallel.neighbour_counts("@")
+        assert solve(parallel, iterate_until_stable, workers=3) == solve(
+            serial, iterate_until_stable
+        )
+        assert parallel.cells == serial.cells
+        assert bytes(parallel.neighbour_counts("@")) == bytes(serial.neighbour_counts("@"))
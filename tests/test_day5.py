@@ -1,8 +1,23 @@
+import random
+import tracemalloc
+
+import pytest
+
 from days.day5 import (
+    IntervalSet,
+    count_fresh,
+    count_in_intervals,
     count_numbers_in_intervals,
+    in_intervals,
+    interval_starts,
+    merge_interval_runs,
     merge_intervals,
+    merge_intervals_parallel,
+    parse_intervals,
+    read_merged_intervals,
     solve,
     solve2,
+    solve_stream,
     split_by_double_newline,
 )
 
@@ -100,3 +115,149 @@ def test_solve2():
     # Count: (5-3+1) + (20-10+1) = 3 + 11 = 14
     result = solve2(input)
     assert result == 14
+
+
+def test_in_intervals():
+    merged = merge_intervals([(3, 5), (10, 14), (16, 20), (12, 18)])
+    starts = interval_starts(merged)
+    assert [value for value in range(25) if in_intervals(merged, starts, value)] == [
+        3,
+        4,
+        5,
+        *range(10, 21),
+    ]
+    assert in_intervals([], [], 1) is False
+
+
+def test_count_in_intervals_matches_linear_scan():
+    rng = random.Random(15)
+    for _ in range(200):
+        intervals = []
+        for _ in range(rng.randint(0, 10)):
+            start = rng.randint(0, 100)
+            intervals.append((start, start + rng.randint(0, 15)))
+        values = [rng.randint(-5, 120) for _ in range(rng.randint(0, 30))]
+        expected = sum(any(start <= value <= end for start, end in intervals) for value in values)
+        merged = merge_intervals(intervals)
+        starts = interval_starts(merged)
+        assert count_in_intervals(merged, values) == expected
+        assert sum(in_intervals(merged, starts, value) for value in values) == expected
+
+
+def test_parse_intervals():
+    assert parse_intervals("3-5\n10-14\n\n") == [(3, 5), (10, 14)]
+    assert parse_intervals("") == []
+
+
+def test_read_merged_intervals_batches():
+    lines = iter([f"{start}-{start + 2}" for start in range(0, 100, 5)] + ["", "7"])
+    assert read_merged_intervals(lines, batch_size=3) == [
+        (start, start + 2) for start in range(0, 100, 5)
+    ]
+    assert list(lines) == ["7"]
+    assert read_merged_intervals(iter(["1-3", "2-6", "8-9"]), batch_size=1) == [(1, 6), (8, 9)]
+
+
+def test_solve_stream_matches_solve(tmp_path):
+    rng = random.Random(16)
+    for _ in range(20):
+        ranges = []
+        for _ in range(rng.randint(1, 30)):
+            start = rng.randint(0, 500)
+            ranges.append(f"{start}-{start + rng.randint(0, 40)}")
+        ids = [str(rng.randint(0, 600)) for _ in range(rng.randint(0, 50))]
+        input = "\n".join(ranges) + "\n\n" + "\n".join(ids) + "\n"
+        path = tmp_path / "5.txt"
+        path.write_text(input)
+        with open(path) as f:
+            assert solve_stream(f) == (solve(input), solve2(input))
+
+
+def test_solve_stream_memory_is_bounded():
+    def lines():
+        for start in range(0, 10_000, 10):
+            yield f"{start}-{start + 20}"
+        yield ""
+        for value in range(200_000):
+            yield str(value)
+
+    tracemalloc.start()
+    try:
+        assert solve_stream(lines()) == (10_011, 10_011)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # Holding the ID section as a list would take several megabytes
+    assert peak < 512 * 1024
+
+
+def test_interval_set_matches_python_set():
+    rng = random.Random(17)
+    for _ in range(100):
+        intervals = IntervalSet()
+        reference: set[int] = set()
+        for _ in range(40):
+            start = rng.randint(0, 60)
+            end = start + rng.randint(0, 12)
+            if rng.random() < 0.6:
+                intervals.add(start, end)
+                reference.update(range(start, end + 1))
+            else:
+                intervals.remove(start, end)
+                reference.difference_update(range(start, end + 1))
+
+            assert intervals.count_covered() == len(reference)
+            assert list(intervals) == merge_intervals([(value, value) for value in reference])
+            value = rng.randint(-2, 80)
+            assert intervals.contains(value) is (value in reference)
+            low = rng.randint(-2, 80)
+            high = low + rng.randint(0, 5)
+            assert intervals.overlaps(low, high) is any(
+                v in reference for v in range(low, high + 1)
+            )
+
+
+def test_interval_set_from_intervals():
+    fresh = IntervalSet([(3, 5), (10, 14), (16, 20), (12, 18)])
+    assert list(fresh) == [(3, 5), (10, 20)]
+    assert len(fresh) == 2
+    assert fresh.count_covered() == 14
+    assert 4 in fresh and 8 not in fresh
+
+
+def test_interval_set_rejects_reversed_interval():
+    with pytest.raises(ValueError, match="Expected start <= end"):
+        IntervalSet().add(5, 3)
+
+
+def test_merge_interval_runs_matches_merge_intervals():
+    rng = random.Random(18)
+    for _ in range(100):
+        intervals = []
+        for _ in range(rng.randint(0, 40)):
+            start = rng.randint(0, 200)
+            intervals.append((start, start + rng.randint(0, 20)))
+        runs = [merge_intervals(intervals[index::3]) for index in range(3)]
+        assert merge_interval_runs(runs) == merge_intervals(intervals)
+    assert merge_interval_runs([]) == []
+
+
+def test_merge_intervals_parallel():
+    rng = random.Random(18)
+    lines = []
+    for _ in range(500):
+        start = rng.randint(0, 10_000)
+        lines.append(f"{start}-{start + rng.randint(0, 50)}")
+    lines.append("")
+    assert merge_intervals_parallel(lines, workers=3) == merge_intervals(
+        parse_intervals("\n".join(lines))
+    )
+    input = "3-5\n10-14\n16-20\n12-18\n\n1\n5"
+    assert solve2(input, workers=2) == solve2(input) == 14
+
+
+def test_count_fresh_beyond_64_bits():
+    huge = 2**64
+    merged = [(3, 5), (huge, huge + 10)]
+    assert count_fresh(merged, ["4", "", str(huge + 3), str(huge + 11)]) == 2
+    assert solve_stream([f"{huge}-{huge + 10}", "", str(huge + 3)]) == (1, 11)
@@ -1,9 +1,17 @@
+import math
+import random
+import re
+
 from days.day6 import (
+    PRODUCT_TREE_THRESHOLD,
+    ProductTree,
     apply_operation,
     get_column_values,
+    iter_problem_groups,
     solve,
-    string_to_grid_by_row_and_spaces,
     solve_part_2,
+    split_operations_row,
+    string_to_grid_by_row_and_spaces,
 )
 
 
@@ -85,3 +93,137 @@ def test_solve():
 
     result_part_2 = solve_part_2(input_str)
     assert result_part_2 == 3263827
+
+
+def _solve_by_columns(input_str: str) -> int:
+    """Reference: build the full grid, then walk it once per column."""
+    grid = string_to_grid_by_row_and_spaces(input_str, strip=False)
+    if len(grid) < 2:
+        return 0
+    total = 0
+    for col_idx, operation in enumerate(grid[-1]):
+        values = get_column_values(grid[:-1], col_idx)
+        result = apply_operation(operation, values)
+        if result is not None:
+            total += result
+    return total
+
+
+def test_split_operations_row():
+    assert split_operations_row("1 2\n3 4\n*  +\n\n") == ("1 2\n3 4", ["*", "+"])
+    assert split_operations_row("1 2\r\n+ *") == ("1 2\r", ["+", "*"])
+    assert split_operations_row("+ *") == ("", ["+", "*"])
+
+
+def test_solve_matches_column_walk():
+    rng = random.Random(19)
+    for _ in range(200):
+        columns = rng.randint(1, 8)
+        rows = [
+            " ".join(
+                rng.choice([str(rng.randint(0, 999)), "abc", "-4"])
+                for _ in range(rng.randint(1, columns + 1))
+            )
+            for _ in range(rng.randint(0, 5))
+        ]
+        rows.append("  ".join(rng.choice("+*?") for _ in range(columns)))
+        input_str = "\n".join(rows) + rng.choice(["", "\n", "\n\n"])
+        assert solve(input_str) == _solve_by_columns(input_str)
+
+
+def _groups_by_char_grid(input_str: str) -> list[tuple[list[int], str]]:
+    """Reference: the original character-grid walk of part 2."""
+    grid = string_to_grid_by_row_and_spaces(input_str, split_by=re.compile(r""))
+    groups = []
+    collected_numbers = []
+    current_number_str = ""
+    for col in range(len(grid[0]) - 1, -1, -1):
+        for row in grid:
+            if col >= len(row):
+                continue
+            cell = row[col]
+            if cell.isdigit():
+                current_number_str += cell
+            elif cell == " " or cell == "":
+                if current_number_str:
+                    collected_numbers.append(int(current_number_str))
+                    current_number_str = ""
+            elif cell == "+" or cell == "*":
+                if current_number_str:
+                    collected_numbers.append(int(current_number_str))
+                    current_number_str = ""
+                if collected_numbers:
+                    groups.append((collected_numbers, cell))
+                    collected_numbers = []
+                break
+    return groups
+
+
+def test_iter_problem_groups():
+    input_str = "123 328  51 64 \n 45 64  387 23 \n  6 98  215 314\n*   +   *   +  "
+    assert list(iter_problem_groups(input_str)) == [
+        ([4, 431, 623], "+"),
+        ([175, 581, 32], "*"),
+        ([8, 248, 369], "+"),
+        ([356, 24, 1], "*"),
+    ]
+    assert list(iter_problem_groups("")) == []
+
+
+def test_iter_problem_groups_matches_char_grid():
+    rng = random.Random(20)
+    for _ in range(300):
+        rows = [
+            "".join(rng.choice("0123456789    x") for _ in range(rng.randint(1, 12)))
+            for _ in range(rng.randint(1, 4))
+        ]
+        rows.append("".join(rng.choice("+*   ") for _ in range(rng.randint(1, 12))))
+        input_str = rng.choice(["\n", "\r\n"]).join(rows)
+        if not input_str.strip():
+            continue
+        assert list(iter_problem_groups(input_str)) == _groups_by_char_grid(input_str)
+
+
+def test_product_tree():
+    rng = random.Random(21)
+    threshold = PRODUCT_TREE_THRESHOLD
+    for count in (0, 1, 2, 7, threshold - 1, threshold, threshold + 1, 3 * threshold, 1000):
+        values = [rng.randint(1, 10**6) for _ in range(count)]
+        product = ProductTree()
+        product.extend(values)
+        assert len(product) == count
+        assert product.result() == math.prod(values)
+
+        modular = ProductTree(mod=1_000_000_007)
+        modular.extend(values)
+        assert modular.result() == math.prod(values) % 1_000_000_007
+
+
+def test_apply_operation_long_and_modular():
+    values = list(range(1, 500))
+    assert apply_operation("*", values) == math.factorial(499)
+    assert apply_operation("*", values, mod=1_000_003) == math.factorial(499) % 1_000_003
+    assert apply_operation("+", values, mod=1000) == sum(values) % 1000
+    assert apply_operation("?", values, mod=7) is None
+
+
+def test_solve_mod():
+    input_str = """123 328  51 64 
+ 45 64  387 23 
+  6 98  215 314
+*   +   *   +  """
+    assert solve(input_str, mod=1009) == 4277556 % 1009
+    assert solve_part_2(input_str, mod=1009) == 3263827 % 1009
+
+
+def test_solve_long_product_column():
+    values = range(2, 2 + 3 * PRODUCT_TREE_THRESHOLD)
+    input_str = "\n".join(f"{value} 1" for value in values) + "\n* +"
+    expected = math.prod(values) + len(values)
+    assert solve(input_str) == expected
+    assert solve(input_str, mod=1_000_003) == expected % 1_000_003
+
+
+def test_solve_skips_non_decimal_digit_tokens():
+    assert solve("1 ²\n+ +") == 1
+    assert solve("2 3\n4 ²\n* +") == 8 + 3